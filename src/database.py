@@ -1,55 +1,79 @@
 import sqlite3
 import os
+import weakref
 
 # Database file path
 DB_FILE = "C:/Users/marti/Projects-2025/vocab-harvester/database/vocab.db"
 TABLE_NAME = "vocab"
 
+# DB_FILE values whose init_database() set up the vocab_fts full-text index
+# (needs FTS5 and SQLite 3.34+ for the trigram tokenizer). get_all_words falls
+# back to LIKE for any other database, including one never initialised here.
+_fts_enabled = {}
+
 # Ensure the database directory exists
 os.makedirs("database", exist_ok=True)
 
+class _TrackedConnection(sqlite3.Connection):
+    """sqlite3.Connection subclass so connections can be held in a WeakSet.
+
+    connect_db() records the DB_FILE each one was opened on as db_file.
+    """
+
+
+# Connections opened by connect_db() that have not been garbage collected yet
+_OPEN_CONNS = weakref.WeakSet()
+
+
 def connect_db():
-    """Connect to SQLite database and return the connection."""
-    return sqlite3.connect(DB_FILE)
+    """Connect to SQLite database and return the connection.
+
+    DB_FILE may also be a "file:" URI, e.g. a shared in-memory database.
+    """
+    conn = sqlite3.connect(DB_FILE, uri=True, factory=_TrackedConnection)
+    conn.db_file = DB_FILE
+    _OPEN_CONNS.add(conn)
+    return conn
 
 def init_database():
     """Initialize the SQLite database with vocabulary and tagging system."""
     conn = connect_db()
     cursor = conn.cursor()
     
-    # Create main vocabulary table (simplified schema)
-    cursor.execute(f"""
+    # Create all tables and indexes as one script in a single transaction
+    cursor.executescript(f"""
+        BEGIN;
+        
+        -- Main vocabulary table (simplified schema)
         CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
             word TEXT PRIMARY KEY,
             pos TEXT,
             is_regular BOOLEAN,
             translation TEXT,
             difficulty INTEGER DEFAULT 3
-        )
-    """)
-    
-    # Create tags table
-    cursor.execute("""
+        );
+        
+        -- Index difficulty filtering with words kept in sorted order (get_all_words)
+        CREATE INDEX IF NOT EXISTS idx_vocab_diff_word
+        ON {TABLE_NAME} (difficulty, word);
+        
+        -- Tags table
         CREATE TABLE IF NOT EXISTS tags (
             tag_id INTEGER PRIMARY KEY AUTOINCREMENT,
             tag_name TEXT UNIQUE NOT NULL,
             description TEXT
-        )
-    """)
-    
-    # Create word_tags junction table for many-to-many relationship
-    cursor.execute("""
+        );
+        
+        -- word_tags junction table for many-to-many relationship
         CREATE TABLE IF NOT EXISTS word_tags (
             word TEXT NOT NULL,
             tag_id INTEGER NOT NULL,
             PRIMARY KEY (word, tag_id),
             FOREIGN KEY (word) REFERENCES vocab (word) ON DELETE CASCADE,
             FOREIGN KEY (tag_id) REFERENCES tags (tag_id) ON DELETE CASCADE
-        )
-    """)
-    
-    # Create temporary processing database table
-    cursor.execute("""
+        );
+        
+        -- Temporary processing database table
         CREATE TABLE IF NOT EXISTS temp_vocab (
             word TEXT NOT NULL,
             lemma TEXT NOT NULL,
@@ -59,12 +83,76 @@ def init_database():
             session_id TEXT NOT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             PRIMARY KEY (word, session_id)
-        )
+        );
+        
+        -- Index session lookups (pending words, session clears) on temp_vocab
+        CREATE INDEX IF NOT EXISTS idx_temp_vocab_session
+        ON temp_vocab (session_id, created_at);
+        
+        COMMIT;
     """)
     
-    conn.commit()
+    _fts_enabled[DB_FILE] = _init_fts(cursor)
     conn.close()
 
+
+def _init_fts(cursor):
+    """Create the vocab_fts full-text index and its sync triggers if SQLite supports them.
+
+    The trigram tokenizer needs SQLite 3.34+ built with FTS5. On other builds the
+    index is skipped and search keeps using LIKE.
+
+    Returns:
+        bool: True if vocab_fts is available, False otherwise
+    """
+    if sqlite3.sqlite_version_info < (3, 34, 0):
+        return False
+    
+    # The full-text table needs a one-time rebuild when added to an existing database
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'vocab_fts'")
+    fts_exists = cursor.fetchone() is not None
+    
+    # Full-text index over word/translation for get_all_words search.
+    # The trigram tokenizer matches arbitrary substrings, like LIKE '%term%' did.
+    schema = f"""
+        BEGIN;
+        
+        CREATE VIRTUAL TABLE IF NOT EXISTS vocab_fts USING fts5(
+            word, translation,
+            content='{TABLE_NAME}', content_rowid='rowid', tokenize='trigram'
+        );
+        
+        CREATE TRIGGER IF NOT EXISTS vocab_fts_ai AFTER INSERT ON {TABLE_NAME} BEGIN
+            INSERT INTO vocab_fts (rowid, word, translation)
+            VALUES (new.rowid, new.word, new.translation);
+        END;
+        
+        CREATE TRIGGER IF NOT EXISTS vocab_fts_ad AFTER DELETE ON {TABLE_NAME} BEGIN
+            INSERT INTO vocab_fts (vocab_fts, rowid, word, translation)
+            VALUES ('delete', old.rowid, old.word, old.translation);
+        END;
+        
+        CREATE TRIGGER IF NOT EXISTS vocab_fts_au AFTER UPDATE ON {TABLE_NAME} BEGIN
+            INSERT INTO vocab_fts (vocab_fts, rowid, word, translation)
+            VALUES ('delete', old.rowid, old.word, old.translation);
+            INSERT INTO vocab_fts (rowid, word, translation)
+            VALUES (new.rowid, new.word, new.translation);
+        END;
+    """
+    if not fts_exists:
+        # Index words that were added before the full-text table existed
+        schema += "INSERT INTO vocab_fts (vocab_fts) VALUES ('rebuild');"
+    schema += "COMMIT;"
+    
+    try:
+        cursor.executescript(schema)
+        return True
+    except sqlite3.OperationalError as e:
+        # e.g. "no such module: fts5" on builds without FTS5
+        cursor.connection.rollback()
+        print(f"Full-text search unavailable, using LIKE search: {e}")
+        return False
+
 def word_exists(word):
     """Check if a word already exists in the database."""
     conn = connect_db()
@@ -81,7 +169,7 @@ def add_word(word, pos, is_regular, translation=None, difficulty=3):
         return
 
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute(f"""
                 INSERT INTO {TABLE_NAME} (word, pos, is_regular, translation, difficulty)
@@ -96,7 +184,7 @@ def add_word(word, pos, is_regular, translation=None, difficulty=3):
 def create_tag(tag_name, description=None):
     """Create a new tag."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT INTO tags (tag_name, description)
@@ -115,7 +203,7 @@ def create_tag(tag_name, description=None):
 def get_tag_id(tag_name):
     """Get tag ID by name."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT tag_id FROM tags WHERE tag_name = ?", (tag_name,))
             result = cursor.fetchone()
@@ -138,7 +226,7 @@ def add_tag_to_word(word, tag_name):
             return False
     
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR IGNORE INTO word_tags (word, tag_id)
@@ -162,7 +250,7 @@ def remove_tag_from_word(word, tag_name):
         return False
     
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 DELETE FROM word_tags WHERE word = ? AND tag_id = ?
@@ -180,7 +268,7 @@ def remove_tag_from_word(word, tag_name):
 def get_word_tags(word):
     """Get all tags for a word."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT t.tag_name, t.description
@@ -196,7 +284,7 @@ def get_word_tags(word):
 def get_words_with_tag(tag_name):
     """Get all words that have a specific tag."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT v.word, v.pos, v.is_regular
@@ -213,7 +301,7 @@ def get_words_with_tag(tag_name):
 def list_all_tags():
     """List all available tags."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT tag_name, description FROM tags ORDER BY tag_name")
             return cursor.fetchall()
@@ -229,7 +317,7 @@ def delete_tag(tag_name):
         return False
     
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             # Delete associations first (will happen automatically due to CASCADE)
             cursor.execute("DELETE FROM tags WHERE tag_id = ?", (tag_id,))
@@ -244,7 +332,7 @@ def delete_tag(tag_name):
 def add_temp_word(word, lemma, pos, translation, is_regular, session_id):
     """Add a word to temporary processing database."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO temp_vocab
@@ -258,10 +346,31 @@ def add_temp_word(word, lemma, pos, translation, is_regular, session_id):
         return False
 
 
+def add_temp_words_bulk(rows):
+    """Add many words to temporary database in a single transaction.
+
+    Each row is (word, lemma, pos, translation, is_regular, session_id),
+    matching the arguments of add_temp_word().
+    """
+    try:
+        with connect_db() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT OR REPLACE INTO temp_vocab
+                (word, lemma, pos, translation, is_regular, session_id)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+            return True
+    except sqlite3.Error as e:
+        print(f"Database error adding temp words: {e}")
+        return False
+
+
 def get_temp_words(session_id=None):
     """Get all words from temporary database, optionally filtered by session."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             if session_id:
                 cursor.execute("""
@@ -283,7 +392,7 @@ def get_temp_words(session_id=None):
 def remove_temp_word(word, session_id):
     """Remove a specific word from temporary database."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 DELETE FROM temp_vocab WHERE word = ? AND session_id = ?
@@ -298,7 +407,7 @@ def remove_temp_word(word, session_id):
 def clear_temp_session(session_id):
     """Remove all words from a specific session."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 DELETE FROM temp_vocab WHERE session_id = ?
@@ -314,7 +423,7 @@ def clear_temp_session(session_id):
 def temp_word_exists(word, session_id):
     """Check if a word exists in temporary database for a specific session."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT word FROM temp_vocab WHERE word = ? AND session_id = ?
@@ -326,6 +435,81 @@ def temp_word_exists(word, session_id):
 
 
 # Word approval workflow functions
+def _get_or_create_tag_id(cursor, tag_name):
+    """Look up a tag's ID on an open cursor, creating the tag if needed."""
+    cursor.execute("SELECT tag_id FROM tags WHERE tag_name = ?", (tag_name,))
+    result = cursor.fetchone()
+    if result:
+        return result[0]
+
+    cursor.execute("""
+        INSERT INTO tags (tag_name, description)
+        VALUES (?, NULL)
+    """, (tag_name,))
+    return cursor.lastrowid
+
+
+def _approve_with_cursor(cursor, lemma, session_id, difficulty, tags):
+    """
+    Move one word from temporary database to main vocabulary on an open cursor.
+
+    The caller owns the transaction. Words that already exist in the main
+    vocabulary are removed from the session but not inserted again.
+
+    Returns:
+        bool: True if the word was inserted, False otherwise
+    """
+    # Find the word in temp database
+    cursor.execute("""
+        SELECT word, lemma, pos, translation, is_regular
+        FROM temp_vocab
+        WHERE lemma = ? AND session_id = ?
+        LIMIT 1
+    """, (lemma, session_id))
+
+    temp_word = cursor.fetchone()
+    if not temp_word:
+        print(f"Word '{lemma}' not found in session '{session_id}'")
+        return False
+
+    word, lemma_found, pos, translation, is_regular = temp_word
+
+    # Check if word already exists in main database
+    cursor.execute(f"SELECT word FROM {TABLE_NAME} WHERE word = ?", (lemma_found,))
+    if cursor.fetchone():
+        print(f"Word '{lemma_found}' already exists in main database")
+        # Remove from temp even if already exists
+        cursor.execute("""
+            DELETE FROM temp_vocab WHERE lemma = ? AND session_id = ?
+        """, (lemma, session_id))
+        return False
+
+    # Insert word into main database
+    cursor.execute(f"""
+        INSERT INTO {TABLE_NAME} (word, pos, is_regular, translation, difficulty)
+        VALUES (?, ?, ?, ?, ?)
+    """, (lemma_found, pos, is_regular, translation, difficulty))
+
+    # Add tags if provided
+    if tags:
+        for tag_name in tags:
+            tag_id = _get_or_create_tag_id(cursor, tag_name)
+
+            # Add tag association
+            cursor.execute("""
+                INSERT OR IGNORE INTO word_tags (word, tag_id)
+                VALUES (?, ?)
+            """, (lemma_found, tag_id))
+
+    # Remove from temporary database
+    cursor.execute("""
+        DELETE FROM temp_vocab WHERE lemma = ? AND session_id = ?
+    """, (lemma, session_id))
+
+    print(f"Approved word '{lemma_found}' and moved to main database")
+    return True
+
+
 def approve_word(lemma, session_id, difficulty=3, tags=None):
     """
     Approve a word from temporary database and move it to main vocabulary.
@@ -340,76 +524,44 @@ def approve_word(lemma, session_id, difficulty=3, tags=None):
         bool: True if successful, False otherwise
     """
     try:
-        with sqlite3.connect(DB_FILE) as conn:
-            cursor = conn.cursor()
+        with connect_db() as conn:
+            approved = _approve_with_cursor(conn.cursor(), lemma, session_id, difficulty, tags)
+            conn.commit()
+            return approved
 
-            # Find the word in temp database
-            cursor.execute("""
-                SELECT word, lemma, pos, translation, is_regular
-                FROM temp_vocab
-                WHERE lemma = ? AND session_id = ?
-                LIMIT 1
-            """, (lemma, session_id))
+    except sqlite3.Error as e:
+        print(f"Database error approving word: {e}")
+        return False
 
-            temp_word = cursor.fetchone()
-            if not temp_word:
-                print(f"Word '{lemma}' not found in session '{session_id}'")
-                return False
 
-            word, lemma_found, pos, translation, is_regular = temp_word
+def approve_words_batch(approvals):
+    """
+    Approve several words from temporary database in a single transaction.
 
-            # Check if word already exists in main database
-            cursor.execute(f"SELECT word FROM {TABLE_NAME} WHERE word = ?", (lemma_found,))
-            if cursor.fetchone():
-                print(f"Word '{lemma_found}' already exists in main database")
-                # Remove from temp even if already exists
-                cursor.execute("""
-                    DELETE FROM temp_vocab WHERE lemma = ? AND session_id = ?
-                """, (lemma, session_id))
-                conn.commit()
-                return False
+    Same rules as approve_word(): words missing from their session are skipped,
+    words already in the main vocabulary are only removed from the session.
 
-            # Insert word into main database
-            cursor.execute(f"""
-                INSERT INTO {TABLE_NAME} (word, pos, is_regular, translation, difficulty)
-                VALUES (?, ?, ?, ?, ?)
-            """, (lemma_found, pos, is_regular, translation, difficulty))
-
-            # Add tags if provided
-            if tags:
-                for tag_name in tags:
-                    # Get or create tag
-                    cursor.execute("SELECT tag_id FROM tags WHERE tag_name = ?", (tag_name,))
-                    result = cursor.fetchone()
-
-                    if result:
-                        tag_id = result[0]
-                    else:
-                        # Create new tag
-                        cursor.execute("""
-                            INSERT INTO tags (tag_name, description)
-                            VALUES (?, NULL)
-                        """, (tag_name,))
-                        tag_id = cursor.lastrowid
-
-                    # Add tag association
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO word_tags (word, tag_id)
-                        VALUES (?, ?)
-                    """, (lemma_found, tag_id))
-
-            # Remove from temporary database
-            cursor.execute("""
-                DELETE FROM temp_vocab WHERE lemma = ? AND session_id = ?
-            """, (lemma, session_id))
+    Args:
+        approvals: Iterable of (lemma, session_id, difficulty, tags) tuples,
+                   where tags is a list of tag names or None
+
+    Returns:
+        int: Number of words moved to main vocabulary
+    """
+    try:
+        with connect_db() as conn:
+            cursor = conn.cursor()
+            approved_count = 0
+            for lemma, session_id, difficulty, tags in approvals:
+                if _approve_with_cursor(cursor, lemma, session_id, difficulty, tags):
+                    approved_count += 1
 
             conn.commit()
-            print(f"Approved word '{lemma_found}' and moved to main database")
-            return True
+            return approved_count
 
     except sqlite3.Error as e:
-        print(f"Database error approving word: {e}")
-        return False
+        print(f"Database error approving words: {e}")
+        return 0
 
 
 def prompt_difficulty():
@@ -447,7 +599,7 @@ def reject_word(lemma, session_id):
         bool: True if word was removed, False otherwise
     """
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 DELETE FROM temp_vocab WHERE lemma = ? AND session_id = ?
@@ -508,7 +660,7 @@ def get_all_words(filters=None, search_term=None):
               Ordered alphabetically by word
     """
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
 
             # Build query
@@ -522,7 +674,12 @@ def get_all_words(filters=None, search_term=None):
                 params.append(filters['difficulty'])
 
             # Add search filter if provided
-            if search_term:
+            if search_term and len(search_term) >= 3 and _fts_enabled.get(DB_FILE):
+                # Quoted phrase so FTS syntax characters in the term are matched literally
+                conditions.append("rowid IN (SELECT rowid FROM vocab_fts WHERE vocab_fts MATCH ?)")
+                params.append('"' + search_term.replace('"', '""') + '"')
+            elif search_term:
+                # No full-text index, or a term too short for the trigram tokenizer
                 conditions.append("(word LIKE ? OR translation LIKE ?)")
                 search_pattern = f"%{search_term}%"
                 params.extend([search_pattern, search_pattern])
@@ -551,7 +708,7 @@ def get_all_sessions():
               Ordered by created_at DESC (newest first)
     """
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT
@@ -581,7 +738,7 @@ def get_session_stats(session_id):
               Returns {'total': 0, 'pending': 0} if session not found
     """
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
 
             # Count total words in session
@@ -611,7 +768,7 @@ def get_word_count():
         int: Total word count
     """
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db() as conn:
             cursor = conn.cursor()
             cursor.execute(f"SELECT COUNT(*) FROM {TABLE_NAME}")
             return cursor.fetchone()[0]
@@ -14,7 +14,7 @@ from session_manager import (
     start_processing_session,
     get_session_info
 )
-from database import get_pending_words, approve_word, reject_word, prompt_difficulty
+from database import get_pending_words, approve_word, approve_words_batch, reject_word, prompt_difficulty
 from review import review_interface, review_pending_words
 
 
@@ -210,11 +210,11 @@ def quick_review_session(session_id):
         print("\nApproving all words...")
         difficulty = prompt_difficulty()
 
-        approved = 0
-        for word_data in pending:
-            word, lemma, pos, translation, is_regular, sess_id, created_at = word_data
-            if approve_word(lemma, session_id, difficulty):
-                approved += 1
+        # One transaction for the whole session instead of one commit per word
+        approved = approve_words_batch(
+            (lemma, session_id, difficulty, None)
+            for word, lemma, pos, translation, is_regular, sess_id, created_at in pending
+        )
         print(f"Approved {approved} word(s) with difficulty {difficulty}.")
 
     elif choice == "R":
@@ -2,11 +2,20 @@ import spacy
 import re
 import uuid
 from datetime import datetime
-from database import word_exists, add_temp_word, temp_word_exists
+from database import word_exists, add_temp_words_bulk, temp_word_exists
 from translation import get_best_translation
 
-# Load German NLP model
-nlp = spacy.load("de_core_news_sm")
+# German NLP model, loaded on first use so importing the parser stays cheap
+_nlp = None
+
+
+def _get_nlp():
+    """Return the German spaCy pipeline, loading it on first call."""
+    global _nlp
+    if _nlp is None:
+        _nlp = spacy.load("de_core_news_sm")
+    return _nlp
+
 
 # Load irregular verbs into a set for fast lookup
 with open("C:/Users/marti/Projects-2025/vocab-harvester/data/irregular_Verbs.txt", "r", encoding="utf-8") as f:
@@ -31,7 +40,7 @@ def tokenize_text(text):
     if not text:
         return []
 
-    doc = nlp(text)
+    doc = _get_nlp()(text)
     # Extract tokens that are actual words (not punctuation, whitespace, etc.)
     tokens = [token.text.lower() for token in doc if token.is_alpha]
 
@@ -72,7 +81,7 @@ def lemmatize_words(tokens):
 
     # Process all tokens at once for efficiency
     text_to_process = " ".join(tokens)
-    doc = nlp(text_to_process)
+    doc = _get_nlp()(text_to_process)
 
     lemmatized = []
     for token in doc:
@@ -140,17 +149,19 @@ def process_text_input(raw_text, session_id=None):
         }
 
     # Step 5: Process words with automatic translation and temp database storage
-    added_count = 0
     translated_count = 0
+    rows = []
+    seen = set()
 
     for word_data in unknown_words:
         lemma = word_data['lemma']
         pos = word_data['pos']
         original = word_data['original']
 
-        # Check if word already exists in temp database for this session
-        if temp_word_exists(original, session_id):
+        # Skip words already stored for this session or queued in this batch
+        if original in seen or temp_word_exists(original, session_id):
             continue
+        seen.add(original)
 
         # Automatically determine if verb is irregular
         if pos in {"VERB", "AUX"}:
@@ -163,10 +174,10 @@ def process_text_input(raw_text, session_id=None):
         if translation:
             translated_count += 1
 
-        # Add to temporary database with translation (if available)
-        success = add_temp_word(original, lemma, pos, translation, is_regular, session_id)
-        if success:
-            added_count += 1
+        rows.append((original, lemma, pos, translation, is_regular, session_id))
+
+    # Add all new words to temporary database in one transaction
+    added_count = len(rows) if rows and add_temp_words_bulk(rows) else 0
 
     # Return processing results
     return {
@@ -6,19 +6,16 @@ Review interface for managing temporary database and transferring words to main
 from database import (
     get_temp_words, add_word, word_exists, add_tag_to_word,
     remove_temp_word, clear_temp_session, approve_word, prompt_difficulty,
-    get_pending_words, reject_word
+    get_pending_words, reject_word, get_all_sessions
 )
 
 def list_temp_sessions():
     """List all unique session IDs in temporary database."""
-    temp_words = get_temp_words()
+    # Aggregate per session in SQL rather than fetching every pending word.
+    # get_all_sessions() is newest-first; keep the oldest-first menu order.
     sessions = {}
-    
-    for word_record in temp_words:
-        word, lemma, pos, translation, is_regular, session_id, created_at = word_record
-        if session_id not in sessions:
-            sessions[session_id] = {'count': 0, 'created_at': created_at}
-        sessions[session_id]['count'] += 1
+    for session_id, word_count, created_at in reversed(get_all_sessions()):
+        sessions[session_id] = {'count': word_count, 'created_at': created_at}
     
     return sessions
 
@@ -4,6 +4,9 @@ import time
 import logging
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.exceptions import ReadTimeoutError
 
 # Configure logging for translation service
 logging.basicConfig(level=logging.INFO)
@@ -22,10 +25,28 @@ class TranslationService:
         self.session.headers.update({
             'User-Agent': 'VocabHarvester/1.0 (https://github.com/martin-widmann/vocab-harvester)'
         })
+        
+        # Retry connection errors, timeouts, rate limiting (429, honoring
+        # Retry-After) and server-side failures; other 4xx responses (e.g. a page
+        # that does not exist) would fail the same way on every attempt.
+        # max_retries counts total attempts, urllib3 counts retries after the first.
+        retry = Retry(
+            total=max(max_retries - 1, 0),
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            backoff_factor=0.5,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def _make_request(self, url: str) -> Optional[Dict]:
         """
-        Make HTTP request with error handling and retry logic.
+        Make HTTP request with error handling.
+        
+        Retries with exponential backoff are handled by the session's adapter.
         
         Args:
             url: The URL to request
@@ -33,40 +54,33 @@ class TranslationService:
         Returns:
             Dictionary with response data or None if request failed
         """
-        last_exception = None
-        
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response.json()
-                
-            except requests.exceptions.Timeout:
-                last_exception = f"Request timed out after {self.timeout} seconds"
-                logger.warning(f"Attempt {attempt + 1}/{self.max_retries}: {last_exception}")
-                
-            except requests.exceptions.ConnectionError:
-                last_exception = "Network connection error"
-                logger.warning(f"Attempt {attempt + 1}/{self.max_retries}: {last_exception}")
-                
-            except requests.exceptions.HTTPError as e:
-                last_exception = f"HTTP error {e.response.status_code}"
-                logger.warning(f"Attempt {attempt + 1}/{self.max_retries}: {last_exception}")
-                
-            except requests.exceptions.RequestException as e:
-                last_exception = f"Request error: {str(e)}"
-                logger.warning(f"Attempt {attempt + 1}/{self.max_retries}: {last_exception}")
-                
-            except json.JSONDecodeError:
-                last_exception = "Invalid JSON response"
-                logger.warning(f"Attempt {attempt + 1}/{self.max_retries}: {last_exception}")
-                
-            # Wait before retry (exponential backoff)
-            if attempt < self.max_retries - 1:
-                wait_time = 2 ** attempt
-                time.sleep(wait_time)
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+            
+        except requests.exceptions.Timeout:
+            error = f"Request timed out after {self.timeout} seconds"
+            
+        except requests.exceptions.ConnectionError as e:
+            # Read timeouts that exhausted the adapter's retries arrive wrapped
+            # in a ConnectionError(MaxRetryError)
+            reason = getattr(e.args[0], 'reason', None) if e.args else None
+            if isinstance(reason, ReadTimeoutError):
+                error = f"Request timed out after {self.timeout} seconds"
+            else:
+                error = "Network connection error"
+            
+        except requests.exceptions.HTTPError as e:
+            error = f"HTTP error {e.response.status_code}"
+            
+        except requests.exceptions.RequestException as e:
+            error = f"Request error: {str(e)}"
+            
+        except json.JSONDecodeError:
+            error = "Invalid JSON response"
         
-        logger.error(f"All {self.max_retries} attempts failed. Last error: {last_exception}")
+        logger.error(f"Request failed: {error}")
         return None
     
     def _extract_translations(self, page_content: str, pos: str) -> List[str]:
@@ -151,7 +165,8 @@ class TranslationService:
             for link in all_links[:5]:  # Take first 5
                 if '|' in link:
                     link = link.split('|')[0]  # Take the actual link, not display text
-                if link and len(link.split()) <= 2 and re.match(r'^[a-zA-Z\s]+$', link):
+                letters = link.replace(' ', '')
+                if link and len(link.split()) <= 2 and letters.isascii() and letters.isalpha():
                     translations.append(link)
         
         # Clean up translations
@@ -162,7 +177,8 @@ class TranslationService:
             trans = re.sub(r'\[\[(.*?)\]\]', r'\1', trans)
             trans = re.sub(r'{{.*?}}', '', trans)
             # Keep only alphabetic words (including spaces for compound words)
-            if trans and re.match(r'^[a-z\s]+$', trans) and len(trans) <= 20:
+            letters = trans.replace(' ', '')
+            if trans and len(trans) <= 20 and letters.isascii() and letters.isalpha() and trans.islower():
                 cleaned_translations.append(trans)
         
         return list(set(cleaned_translations))[:5]  # Return up to 5 unique translations
@@ -196,7 +212,7 @@ class TranslationService:
         params = {
             'action': 'query',
             'format': 'json',
-            'titles': lemma_clean,
+            'titles': lemma_encoded,
             'prop': 'revisions',
             'rvprop': 'content',
             'rvslots': 'main'
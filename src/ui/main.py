@@ -4,8 +4,10 @@ import sys
 import os
 import tkinter as tk
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add parent directory to path for imports (once, even if re-imported)
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+if UI_DIR not in sys.path:
+    sys.path.insert(0, UI_DIR)
 
 from app import VocabHarvesterApp
 
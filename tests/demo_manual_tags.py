@@ -1,21 +1,23 @@
 #!/usr/bin/env python3
-"""Test script to demonstrate manual tagging per word"""
+"""Demo script showing manual tagging per word (prints only; not collected by pytest)"""
 
 import sys
 import os
+import uuid
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from database import add_tag_to_word, get_word_tags, get_words_with_tag, list_all_tags
+from database import add_tag_to_word, get_word_tags, get_words_with_tag, list_all_tags, clear_temp_session
 from parser import process_text_input
 
-def test_manual_tagging():
+def demo_manual_tagging():
     print("Testing manual tagging system...")
     print("=" * 50)
     
-    # First, let's add some words without tags (non-interactive)
+    # First, let's add some words without tags, in a session of our own
+    session_id = f"demo_manual_tags_{uuid.uuid4().hex[:8]}"
     test_text = "Das ist schwierig"
     print(f"Processing text non-interactively: {test_text}")
-    process_text_input(test_text, interactive=False)
+    process_text_input(test_text, session_id=session_id)
     
     print("\n" + "-" * 50)
     print("Now manually adding tags to specific words:")
@@ -50,5 +52,7 @@ def test_manual_tagging():
     for tag_name, description in word_tags:
         print(f"  • {tag_name}: {description or 'No description'}")
 
+    clear_temp_session(session_id)
+
 if __name__ == "__main__":
-    test_manual_tagging()
\ No newline at end of file
+    demo_manual_tagging()
\ No newline at end of file
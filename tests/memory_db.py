@@ -0,0 +1,45 @@
+"""
+Shared in-memory test database for the database-backed test modules.
+"""
+
+import uuid
+
+import database
+
+
+class MemoryDatabase:
+    """Fresh shared-cache in-memory database that database.DB_FILE points at while open.
+
+    open() swaps DB_FILE to a uuid-named URI, holds one keepalive connection and
+    creates the schema; close() closes only the connections opened on that URI
+    and restores whatever DB_FILE was set before. Also usable as a context
+    manager yielding the keepalive connection.
+    """
+
+    def __init__(self, name="test"):
+        self.uri = f"file:{name}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self.conn = None
+        self._previous_db_file = None
+
+    def open(self):
+        """Point DB_FILE at this database, initialise it and return the keepalive connection."""
+        self._previous_db_file = database.DB_FILE
+        database.DB_FILE = self.uri
+        # Hold one connection open so the in-memory database survives between calls
+        self.conn = database.connect_db()
+        database.init_database()
+        return self.conn
+
+    def close(self):
+        """Drop the database by closing every connection to it, then restore DB_FILE."""
+        for conn in list(database._OPEN_CONNS):
+            if conn.db_file == self.uri:
+                conn.close()
+        self.conn = None
+        database.DB_FILE = self._previous_db_file
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
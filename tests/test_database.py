@@ -10,6 +10,10 @@ Tests cover:
 - Error handling for invalid operations
 - Database integrity during transfer operations
 - Concurrent session handling
+
+Each test class uses uuid-suffixed session ids and the module runs against
+its own in-memory database, so classes can run in parallel, e.g.
+`pytest -n auto tests/test_database.py` with pytest-xdist installed.
 """
 
 import sys
@@ -17,6 +21,7 @@ import os
 import unittest
 import uuid
 import sqlite3
+import functools
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -28,6 +33,7 @@ from database import (  # noqa: E402
     get_pending_words,
     clear_session,
     add_temp_word,
+    add_temp_words_bulk,
     word_exists,
     get_word_tags,
     get_temp_words,
@@ -35,9 +41,52 @@ from database import (  # noqa: E402
     remove_temp_word,
     clear_temp_session,
     connect_db,
-    DB_FILE,
     TABLE_NAME
 )
+from memory_db import MemoryDatabase  # noqa: E402
+
+# Shared in-memory database used instead of the real DB_FILE for this module;
+# its keepalive connection doubles as the connection for cleanup/verification SQL
+TEST_DB = MemoryDatabase("vocab_test")
+_CONN = None
+
+
+def setUpModule():
+    """Point the database module at a shared in-memory DB and open the test connection."""
+    global _CONN
+    _CONN = TEST_DB.open()
+    # Autocommit, so _exec callers can issue their own BEGIN/COMMIT
+    _CONN.isolation_level = None
+    _CONN.execute("PRAGMA busy_timeout=30000")
+
+
+def tearDownModule():
+    """Close the shared connection and restore the real database path.
+
+    Test classes use uuid-suffixed session ids and leave their temp words in
+    place; closing the last connection discards the in-memory database.
+    """
+    TEST_DB.close()
+
+
+def _exec(sql, params=()):
+    """Execute a statement on the shared connection and return its cursor."""
+    return _CONN.execute(sql, params)
+
+
+@functools.lru_cache(maxsize=256)
+def _tag_set(word):
+    """Return the tag names assigned to a word (cached; clear in tearDown)."""
+    return frozenset(tag[0] for tag in get_word_tags(word))
+
+
+# (word, pos, translation, is_regular) fixtures for TestApproveWordOperations
+APPROVE_WORDS = [
+    ("approve_t_haus", "NOUN", "house", True),
+    ("approve_t_schön", "ADJ", "beautiful", True),
+    ("approve_t_laufen", "VERB", "run", False),
+    ("approve_t_gut", "ADJ", "good", True),
+]
 
 
 class TestApproveWordOperations(unittest.TestCase):
@@ -48,83 +97,69 @@ class TestApproveWordOperations(unittest.TestCase):
         self.test_session = f"test_approve_{uuid.uuid4().hex[:8]}"
 
         # Clean up any existing test words from main database first
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE word IN (?, ?, ?, ?)",
-                               ("testhaus", "testschön", "testlaufen", "testgut"))
-                conn.commit()
-        except sqlite3.Error:
-            pass
+        self._cleanup()
 
         # Add test words to temporary database
-        add_temp_word("testhaus", "testhaus", "NOUN", "house", True, self.test_session)
-        add_temp_word("testschön", "testschön", "ADJ", "beautiful", True, self.test_session)
-        add_temp_word("testlaufen", "testlaufen", "VERB", "run", False, self.test_session)
-        add_temp_word("testgut", "testgut", "ADJ", "good", True, self.test_session)
+        add_temp_words_bulk([
+            (word, word, pos, translation, is_regular, self.test_session)
+            for word, pos, translation, is_regular in APPROVE_WORDS
+        ])
 
     def tearDown(self):
         """Clean up test data."""
-        clear_session(self.test_session)
+        self._cleanup()
+        _tag_set.cache_clear()
 
-        # Also clean up any approved words from main database
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE word IN (?, ?, ?, ?)",
-                               ("testhaus", "testschön", "testlaufen", "testgut"))
-                conn.commit()
-        except sqlite3.Error:
-            pass
+    def _cleanup(self):
+        """Remove approved test words and this session's temp words in one transaction."""
+        _exec("BEGIN")
+        _exec(f"DELETE FROM {TABLE_NAME} WHERE word IN (?, ?, ?, ?)",
+              [word for word, _, _, _ in APPROVE_WORDS])
+        _exec("DELETE FROM temp_vocab WHERE session_id = ?", (self.test_session,))
+        _exec("COMMIT")
 
     def test_approve_word_without_tags(self):
         """Test approving a word without tags."""
-        result = approve_word("testhaus", self.test_session)
+        result = approve_word("approve_t_haus", self.test_session)
 
         # Should succeed
         self.assertTrue(result, "approve_word should return True on success")
 
         # Word should exist in main database
-        self.assertTrue(word_exists("testhaus"), "Approved word should exist in main database")
+        self.assertTrue(word_exists("approve_t_haus"), "Approved word should exist in main database")
 
         # Word should be removed from temp database
-        temp_words = get_temp_words(self.test_session)
-        temp_lemmas = [word[1] for word in temp_words]
-        self.assertNotIn("testhaus", temp_lemmas, "Approved word should be removed from temp database")
+        self.assertFalse(temp_word_exists("approve_t_haus", self.test_session),
+                         "Approved word should be removed from temp database")
 
     def test_approve_word_with_single_tag(self):
         """Test approving a word with a single tag."""
         tags = ["test-single-tag"]
-        result = approve_word("testschön", self.test_session, tags=tags)
+        result = approve_word("approve_t_schön", self.test_session, tags=tags)
 
         # Should succeed
         self.assertTrue(result, "approve_word with tags should return True on success")
 
         # Word should exist in main database
-        self.assertTrue(word_exists("testschön"), "Approved word should exist in main database")
+        self.assertTrue(word_exists("approve_t_schön"), "Approved word should exist in main database")
 
         # Word should have the assigned tag
-        word_tags = get_word_tags("testschön")
-        tag_names = [tag[0] for tag in word_tags]
-        self.assertIn("test-single-tag", tag_names, "Tag should be assigned to approved word")
+        self.assertIn("test-single-tag", _tag_set("approve_t_schön"), "Tag should be assigned to approved word")
 
     def test_approve_word_with_multiple_tags(self):
         """Test approving a word with multiple tags."""
         tags = ["test-noun", "test-beginner", "test-common"]
-        result = approve_word("testlaufen", self.test_session, tags=tags)
+        result = approve_word("approve_t_laufen", self.test_session, tags=tags)
 
         # Should succeed
         self.assertTrue(result, "approve_word with multiple tags should return True on success")
 
         # Word should exist in main database
-        self.assertTrue(word_exists("testlaufen"), "Approved word should exist in main database")
+        self.assertTrue(word_exists("approve_t_laufen"), "Approved word should exist in main database")
 
         # Word should have all assigned tags
-        word_tags = get_word_tags("testlaufen")
-        tag_names = [tag[0] for tag in word_tags]
-
-        for expected_tag in tags:
-            self.assertIn(expected_tag, tag_names, f"Tag '{expected_tag}' should be assigned to approved word")
+        self.assertTrue(set(tags).issubset(_tag_set("approve_t_laufen")),
+                        "All tags should be assigned to approved word")
 
     def test_approve_word_not_found(self):
         """Test approving a word that doesn't exist (error handling)."""
@@ -136,24 +171,23 @@ class TestApproveWordOperations(unittest.TestCase):
     def test_approve_word_already_in_main_db(self):
         """Test database integrity when approving a word that already exists."""
         # First approval should succeed
-        result1 = approve_word("testgut", self.test_session)
+        result1 = approve_word("approve_t_gut", self.test_session)
         self.assertTrue(result1, "First approval should succeed")
 
         # Add it back to temp for second test
-        add_temp_word("testgut", "testgut", "ADJ", "good", True, self.test_session)
+        add_temp_word("approve_t_gut", "approve_t_gut", "ADJ", "good", True, self.test_session)
 
         # Second approval should fail (already exists)
-        result2 = approve_word("testgut", self.test_session)
+        result2 = approve_word("approve_t_gut", self.test_session)
         self.assertFalse(result2, "Second approval should fail (word already exists)")
 
         # But it should still be removed from temp database (cleanup)
-        temp_words = get_temp_words(self.test_session)
-        temp_lemmas = [word[1] for word in temp_words]
-        self.assertNotIn("testgut", temp_lemmas, "Duplicate word should be cleaned from temp database")
+        self.assertFalse(temp_word_exists("approve_t_gut", self.test_session),
+                         "Duplicate word should be cleaned from temp database")
 
     def test_approve_word_invalid_session(self):
         """Test error handling for invalid session."""
-        result = approve_word("testhaus", "invalid_session_xyz")
+        result = approve_word("approve_t_haus", "invalid_session_xyz")
 
         # Should fail gracefully
         self.assertFalse(result, "approve_word should return False for invalid session")
@@ -167,13 +201,11 @@ class TestRejectWordOperations(unittest.TestCase):
         self.test_session = f"test_reject_{uuid.uuid4().hex[:8]}"
 
         # Add test words
-        add_temp_word("rejecttest1", "rejecttest1", "NOUN", "test1_trans", True, self.test_session)
-        add_temp_word("rejecttest2", "rejecttest2", "VERB", "test2_trans", True, self.test_session)
-        add_temp_word("rejecttest3", "rejecttest3", "ADJ", "test3_trans", False, self.test_session)
-
-    def tearDown(self):
-        """Clean up test data."""
-        clear_session(self.test_session)
+        add_temp_words_bulk([
+            ("rejecttest1", "rejecttest1", "NOUN", "test1_trans", True, self.test_session),
+            ("rejecttest2", "rejecttest2", "VERB", "test2_trans", True, self.test_session),
+            ("rejecttest3", "rejecttest3", "ADJ", "test3_trans", False, self.test_session),
+        ])
 
     def test_reject_word_success(self):
         """Test successfully rejecting a word."""
@@ -183,9 +215,8 @@ class TestRejectWordOperations(unittest.TestCase):
         self.assertTrue(result, "reject_word should return True on success")
 
         # Word should be removed from temp database
-        temp_words = get_temp_words(self.test_session)
-        temp_lemmas = [word[1] for word in temp_words]
-        self.assertNotIn("rejecttest1", temp_lemmas, "Rejected word should be removed from temp database")
+        self.assertFalse(temp_word_exists("rejecttest1", self.test_session),
+                         "Rejected word should be removed from temp database")
 
     def test_reject_word_not_found(self):
         """Test error handling when rejecting non-existent word."""
@@ -220,22 +251,20 @@ class TestRejectWordOperations(unittest.TestCase):
 class TestGetPendingWords(unittest.TestCase):
     """Test get_pending_words() with session filtering."""
 
-    def setUp(self):
-        """Set up test environment with multiple sessions."""
-        self.test_session1 = f"test_pending_1_{uuid.uuid4().hex[:8]}"
-        self.test_session2 = f"test_pending_2_{uuid.uuid4().hex[:8]}"
+    @classmethod
+    def setUpClass(cls):
+        """Set up multiple sessions once; every test in this class only reads them."""
+        cls.test_session1 = f"test_pending_1_{uuid.uuid4().hex[:8]}"
+        cls.test_session2 = f"test_pending_2_{uuid.uuid4().hex[:8]}"
 
         # Add words to different sessions
-        add_temp_word("pending1", "pending1", "NOUN", "trans1", True, self.test_session1)
-        add_temp_word("pending2", "pending2", "VERB", "trans2", True, self.test_session1)
-        add_temp_word("pending3", "pending3", "ADJ", "trans3", False, self.test_session1)
-        add_temp_word("pending4", "pending4", "NOUN", "trans4", True, self.test_session2)
-        add_temp_word("pending5", "pending5", "VERB", "trans5", False, self.test_session2)
-
-    def tearDown(self):
-        """Clean up test data."""
-        clear_session(self.test_session1)
-        clear_session(self.test_session2)
+        add_temp_words_bulk([
+            ("pending1", "pending1", "NOUN", "trans1", True, cls.test_session1),
+            ("pending2", "pending2", "VERB", "trans2", True, cls.test_session1),
+            ("pending3", "pending3", "ADJ", "trans3", False, cls.test_session1),
+            ("pending4", "pending4", "NOUN", "trans4", True, cls.test_session2),
+            ("pending5", "pending5", "VERB", "trans5", False, cls.test_session2),
+        ])
 
     def test_get_pending_words_specific_session(self):
         """Test getting pending words for a specific session."""
@@ -245,12 +274,9 @@ class TestGetPendingWords(unittest.TestCase):
         self.assertEqual(len(pending), 3, "Should return 3 words from session 1")
 
         # Should contain correct words
-        lemmas = [word[1] for word in pending]
-        self.assertIn("pending1", lemmas, "Should contain pending1")
-        self.assertIn("pending2", lemmas, "Should contain pending2")
-        self.assertIn("pending3", lemmas, "Should contain pending3")
-        self.assertNotIn("pending4", lemmas, "Should not contain words from other session")
-        self.assertNotIn("pending5", lemmas, "Should not contain words from other session")
+        lemmas = {word[1] for word in pending}
+        self.assertEqual(lemmas, {"pending1", "pending2", "pending3"},
+                         "Should contain only session 1 words")
 
     def test_get_pending_words_another_session(self):
         """Test getting pending words for another session."""
@@ -260,10 +286,8 @@ class TestGetPendingWords(unittest.TestCase):
         self.assertEqual(len(pending), 2, "Should return 2 words from session 2")
 
         # Should contain correct words
-        lemmas = [word[1] for word in pending]
-        self.assertIn("pending4", lemmas, "Should contain pending4")
-        self.assertIn("pending5", lemmas, "Should contain pending5")
-        self.assertNotIn("pending1", lemmas, "Should not contain words from other session")
+        lemmas = {word[1] for word in pending}
+        self.assertEqual(lemmas, {"pending4", "pending5"}, "Should contain only session 2 words")
 
     def test_get_pending_words_all_sessions(self):
         """Test getting pending words from all sessions."""
@@ -273,9 +297,17 @@ class TestGetPendingWords(unittest.TestCase):
         self.assertGreaterEqual(len(pending), 5, "Should return at least 5 words from all sessions")
 
         # Should contain words from both sessions
-        lemmas = [word[1] for word in pending]
-        self.assertIn("pending1", lemmas, "Should contain words from session 1")
-        self.assertIn("pending4", lemmas, "Should contain words from session 2")
+        self.assertLessEqual({"pending1", "pending4"}, {word[1] for word in pending},
+                             "Should contain words from both sessions")
+
+    def test_session_lookup_uses_index(self):
+        """Test that session filtering uses the temp_vocab session index."""
+        plan = _exec("EXPLAIN QUERY PLAN SELECT * FROM temp_vocab WHERE session_id = ?",
+                     (self.test_session1,)).fetchall()
+        details = " ".join(row[-1] for row in plan)
+
+        self.assertIn("USING INDEX idx_temp_vocab_session", details,
+                      "Session lookups should not scan the whole temp table")
 
     def test_get_pending_words_empty_session(self):
         """Test getting pending words from empty session."""
@@ -306,12 +338,10 @@ class TestClearSession(unittest.TestCase):
         self.test_session = f"test_clear_{uuid.uuid4().hex[:8]}"
 
         # Add multiple test words
-        for i in range(7):
-            add_temp_word(f"clearword{i}", f"clearword{i}", "NOUN", f"trans{i}", True, self.test_session)
-
-    def tearDown(self):
-        """Clean up test data."""
-        clear_session(self.test_session)
+        add_temp_words_bulk(
+            (f"clearword{i}", f"clearword{i}", "NOUN", f"trans{i}", True, self.test_session)
+            for i in range(7)
+        )
 
     def test_clear_session_success(self):
         """Test successfully clearing a session."""
@@ -350,6 +380,20 @@ class TestClearSession(unittest.TestCase):
         removed3 = clear_session(self.test_session)
         self.assertEqual(removed3, 0, "Third clear should remove 0 words")
 
+    def test_clear_session_after_rows_added_elsewhere(self):
+        """Test that a cleared session is cleared again when another connection adds rows."""
+        clear_session(self.test_session)
+
+        # Insert through the test connection, bypassing add_temp_word
+        _exec("""
+            INSERT INTO temp_vocab (word, lemma, pos, translation, is_regular, session_id)
+            VALUES ('clearword_again', 'clearword_again', 'NOUN', 'again', 1, ?)
+        """, (self.test_session,))
+
+        removed = clear_session(self.test_session)
+        self.assertEqual(removed, 1, "Row added by another connection should be cleared")
+        self.assertFalse(temp_word_exists("clearword_again", self.test_session))
+
 
 class TestConcurrentSessions(unittest.TestCase):
     """Test concurrent session handling and isolation."""
@@ -361,20 +405,14 @@ class TestConcurrentSessions(unittest.TestCase):
         self.session_c = f"concurrent_c_{uuid.uuid4().hex[:8]}"
 
         # Add words to different sessions
-        add_temp_word("word_a1", "word_a1", "NOUN", "trans_a1", True, self.session_a)
-        add_temp_word("word_a2", "word_a2", "VERB", "trans_a2", False, self.session_a)
-
-        add_temp_word("word_b1", "word_b1", "ADJ", "trans_b1", True, self.session_b)
-        add_temp_word("word_b2", "word_b2", "NOUN", "trans_b2", True, self.session_b)
-        add_temp_word("word_b3", "word_b3", "VERB", "trans_b3", False, self.session_b)
-
-        add_temp_word("word_c1", "word_c1", "ADJ", "trans_c1", True, self.session_c)
-
-    def tearDown(self):
-        """Clean up test data."""
-        clear_session(self.session_a)
-        clear_session(self.session_b)
-        clear_session(self.session_c)
+        add_temp_words_bulk([
+            ("word_a1", "word_a1", "NOUN", "trans_a1", True, self.session_a),
+            ("word_a2", "word_a2", "VERB", "trans_a2", False, self.session_a),
+            ("word_b1", "word_b1", "ADJ", "trans_b1", True, self.session_b),
+            ("word_b2", "word_b2", "NOUN", "trans_b2", True, self.session_b),
+            ("word_b3", "word_b3", "VERB", "trans_b3", False, self.session_b),
+            ("word_c1", "word_c1", "ADJ", "trans_c1", True, self.session_c),
+        ])
 
     def test_session_isolation(self):
         """Test that sessions are properly isolated from each other."""
@@ -389,20 +427,14 @@ class TestConcurrentSessions(unittest.TestCase):
         self.assertEqual(len(words_c), 1, "Session C should have 1 word")
 
         # Check session isolation
-        lemmas_a = [word[1] for word in words_a]
-        lemmas_b = [word[1] for word in words_b]
-        lemmas_c = [word[1] for word in words_c]
-
-        # Session A should only contain its words
-        self.assertIn("word_a1", lemmas_a, "Session A should contain word_a1")
-        self.assertIn("word_a2", lemmas_a, "Session A should contain word_a2")
-        self.assertNotIn("word_b1", lemmas_a, "Session A should not contain words from B")
-        self.assertNotIn("word_c1", lemmas_a, "Session A should not contain words from C")
+        lemmas_a = {word[1] for word in words_a}
+        lemmas_b = {word[1] for word in words_b}
+        lemmas_c = {word[1] for word in words_c}
 
-        # Session B should only contain its words
-        self.assertIn("word_b1", lemmas_b, "Session B should contain word_b1")
-        self.assertNotIn("word_a1", lemmas_b, "Session B should not contain words from A")
-        self.assertNotIn("word_c1", lemmas_b, "Session B should not contain words from C")
+        # Each session should only contain its own words
+        self.assertEqual(lemmas_a, {"word_a1", "word_a2"}, "Session A should only contain its words")
+        self.assertEqual(lemmas_b, {"word_b1", "word_b2", "word_b3"}, "Session B should only contain its words")
+        self.assertEqual(lemmas_c, {"word_c1"}, "Session C should only contain its words")
 
     def test_concurrent_operations(self):
         """Test concurrent operations on different sessions."""
@@ -431,13 +463,7 @@ class TestConcurrentSessions(unittest.TestCase):
         self.assertEqual(len(words_c), 0, "Session C should be empty")
 
         # Clean up approved word from main database
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE word = ?", ("word_a1",))
-                conn.commit()
-        except sqlite3.Error:
-            pass
+        _exec(f"DELETE FROM {TABLE_NAME} WHERE word = ?", ("word_a1",))
 
 
 class TestDatabaseIntegrity(unittest.TestCase):
@@ -446,28 +472,23 @@ class TestDatabaseIntegrity(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         self.test_session = f"test_integrity_{uuid.uuid4().hex[:8]}"
-
-        # Clean up any existing test words from main database
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE word LIKE 'integrity_test%'")
-                conn.commit()
-        except sqlite3.Error:
-            pass
+        self._approved = []
 
     def tearDown(self):
         """Clean up test data."""
-        clear_session(self.test_session)
+        _tag_set.cache_clear()
+
+        # Remove exactly the words this test approved into the main database
+        if self._approved:
+            placeholders = ", ".join("?" * len(self._approved))
+            _exec(f"DELETE FROM {TABLE_NAME} WHERE word IN ({placeholders})", self._approved)
 
-        # Clean up test words from main database
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f"DELETE FROM {TABLE_NAME} WHERE word LIKE 'integrity_test%'")
-                conn.commit()
-        except sqlite3.Error:
-            pass
+    def _approve(self, lemma, **kwargs):
+        """Approve a word from this test's session and track it for cleanup."""
+        result = approve_word(lemma, self.test_session, **kwargs)
+        if result:
+            self._approved.append(lemma)
+        return result
 
     def test_data_integrity_during_approval(self):
         """Test that all word data is correctly transferred during approval."""
@@ -475,14 +496,11 @@ class TestDatabaseIntegrity(unittest.TestCase):
         add_temp_word("integrity_test1", "integrity_test1", "NOUN", "test translation", True, self.test_session)
 
         # Approve word
-        approve_word("integrity_test1", self.test_session)
+        self._approve("integrity_test1")
 
         # Verify data integrity in main database
-        with sqlite3.connect(DB_FILE) as conn:
-            cursor = conn.cursor()
-            cursor.execute(f"SELECT word, pos, is_regular, translation FROM {TABLE_NAME} WHERE word = ?",
-                           ("integrity_test1",))
-            result = cursor.fetchone()
+        result = _exec(f"SELECT word, pos, is_regular, translation FROM {TABLE_NAME} WHERE word = ?",
+                       ("integrity_test1",)).fetchone()
 
         self.assertIsNotNone(result, "Word should exist in main database")
         self.assertEqual(result[0], "integrity_test1", "Word field should match")
@@ -497,11 +515,10 @@ class TestDatabaseIntegrity(unittest.TestCase):
 
         # Approve with tags
         tags = ["test-integrity-tag1", "test-integrity-tag2"]
-        approve_word("integrity_test2", self.test_session, tags=tags)
+        self._approve("integrity_test2", tags=tags)
 
         # Verify tags in database
-        word_tags = get_word_tags("integrity_test2")
-        tag_names = [tag[0] for tag in word_tags]
+        tag_names = _tag_set("integrity_test2")
 
         self.assertEqual(len(tag_names), 2, "Should have 2 tags")
         self.assertIn("test-integrity-tag1", tag_names, "Tag 1 should be assigned")
@@ -520,9 +537,8 @@ class TestDatabaseIntegrity(unittest.TestCase):
         pending = get_pending_words(self.test_session)
         self.assertEqual(len(pending), 1, "Should have 1 remaining word")
 
-        lemmas = [word[1] for word in pending]
-        self.assertNotIn("integrity_test3", lemmas, "Rejected word should be removed")
-        self.assertIn("integrity_test4", lemmas, "Other word should remain")
+        self.assertFalse(temp_word_exists("integrity_test3", self.test_session), "Rejected word should be removed")
+        self.assertTrue(temp_word_exists("integrity_test4", self.test_session), "Other word should remain")
 
     def test_cleanup_after_approval(self):
         """Test that temporary data is properly cleaned up after approval."""
@@ -534,7 +550,7 @@ class TestDatabaseIntegrity(unittest.TestCase):
                         "Word should exist in temp before approval")
 
         # Approve word
-        approve_word("integrity_test5", self.test_session)
+        self._approve("integrity_test5")
 
         # Verify word is removed from temp
         self.assertFalse(temp_word_exists("integrity_test5", self.test_session),
@@ -552,10 +568,6 @@ class TestErrorHandling(unittest.TestCase):
         """Set up test environment."""
         self.test_session = f"test_error_{uuid.uuid4().hex[:8]}"
 
-    def tearDown(self):
-        """Clean up test data."""
-        clear_session(self.test_session)
-
     def test_approve_with_empty_session_id(self):
         """Test error handling when approving with empty session ID."""
         add_temp_word("errortest1", "errortest1", "NOUN", "test", True, self.test_session)
@@ -616,8 +628,9 @@ def run_all_tests():
         tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
         test_suite.addTests(tests)
 
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+    # Run tests (set TEST_VERBOSITY=2 for per-test output)
+    runner = unittest.TextTestRunner(verbosity=int(os.environ.get('TEST_VERBOSITY', '1')),
+                                     buffer=True, stream=sys.stdout)
     result = runner.run(test_suite)
 
     return result.wasSuccessful()
@@ -11,10 +11,10 @@ Tests the new query functions added for the UI:
 import sys
 import os
 import sqlite3
-import tempfile
-import shutil
-import time
-import gc
+import contextlib
+import inspect
+
+import pytest
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -22,50 +22,58 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 # Import after adding to path
 import database
 
-# Save original DB_FILE path
-ORIGINAL_DB_FILE = database.DB_FILE
-TEST_DB_DIR = None
+from memory_db import MemoryDatabase
+
+TEST_DB = MemoryDatabase()
 
 
 def setup_test_database():
-    """Create a temporary test database."""
-    global TEST_DB_DIR
-    TEST_DB_DIR = tempfile.mkdtemp()
-    test_db_path = os.path.join(TEST_DB_DIR, 'test_vocab.db')
-    database.DB_FILE = test_db_path
-    database.init_database()
-    return test_db_path
+    """Create a fresh shared in-memory test database."""
+    TEST_DB.open()
+    return TEST_DB.uri
 
 
 def teardown_test_database():
-    """Remove the temporary test database."""
-    global TEST_DB_DIR
+    """Drop the in-memory test database and restore the real database path."""
+    TEST_DB.close()
 
-    # Force garbage collection to close any open connections
-    gc.collect()
 
-    # Small delay to ensure connections are closed (Windows issue)
-    time.sleep(0.1)
+def reset_test_database():
+    """Delete all rows from the test database in a single transaction."""
+    TEST_DB.conn.executescript("""
+        BEGIN;
+        DELETE FROM word_tags;
+        DELETE FROM tags;
+        DELETE FROM vocab;
+        DELETE FROM temp_vocab;
+        COMMIT;
+    """)
 
-    if TEST_DB_DIR and os.path.exists(TEST_DB_DIR):
-        try:
-            shutil.rmtree(TEST_DB_DIR)
-        except Exception as e:
-            # On Windows, sometimes files are still locked
-            # Try again after a brief delay
-            time.sleep(0.2)
-            try:
-                shutil.rmtree(TEST_DB_DIR)
-            except Exception:
-                # If it still fails, just pass - temp directory will be cleaned by OS
-                pass
 
-    database.DB_FILE = ORIGINAL_DB_FILE
+@pytest.fixture(scope="module", autouse=True)
+def db():
+    """Create the schema once for this module and drop it afterwards."""
+    setup_test_database()
+    yield
+    teardown_test_database()
 
 
-def add_test_word(word, pos="NOUN", is_regular=None, translation="test", difficulty=3):
-    """Helper function to add a test word to the database."""
-    database.add_word(word, pos, is_regular, translation)
+@pytest.fixture(autouse=True)
+def clean():
+    """Start every test from empty tables."""
+    reset_test_database()
+
+
+def add_test_words_bulk(rows):
+    """Helper function to add test words to the database in one transaction.
+
+    Each row is (word, pos, is_regular, translation, difficulty).
+    """
+    with contextlib.closing(database.connect_db()) as conn, conn:
+        conn.executemany(f"""
+            INSERT INTO {database.TABLE_NAME} (word, pos, is_regular, translation, difficulty)
+            VALUES (?, ?, ?, ?, ?)
+        """, rows)
 
 
 def add_test_temp_word(word, lemma, session_id, pos="NOUN", translation="test"):
@@ -76,257 +84,274 @@ def add_test_temp_word(word, lemma, session_id, pos="NOUN", translation="test"):
 # Test get_word_count()
 def test_get_word_count_empty():
     """Test word count with empty database."""
-    setup_test_database()
-    try:
-        count = database.get_word_count()
-        assert count == 0, f"Expected 0, got {count}"
-        print("[PASS] test_get_word_count_empty")
-    finally:
-        teardown_test_database()
+    count = database.get_word_count()
+    assert count == 0, f"Expected 0, got {count}"
+    print("[PASS] test_get_word_count_empty")
 
 
 def test_get_word_count_with_words():
     """Test word count with multiple words."""
-    setup_test_database()
-    try:
-        # Add test words
-        add_test_word("der mann", "NOUN", None, "the man", 3)
-        add_test_word("die frau", "NOUN", None, "the woman", 2)
-        add_test_word("laufen", "VERB", False, "to run", 4)
+    # Add test words
+    add_test_words_bulk([
+        ("der mann", "NOUN", None, "the man", 3),
+        ("die frau", "NOUN", None, "the woman", 2),
+        ("laufen", "VERB", False, "to run", 4),
+    ])
 
-        count = database.get_word_count()
-        assert count == 3, f"Expected 3, got {count}"
-        print("[PASS] test_get_word_count_with_words")
-    finally:
-        teardown_test_database()
+    count = database.get_word_count()
+    assert count == 3, f"Expected 3, got {count}"
+    print("[PASS] test_get_word_count_with_words")
 
 
 # Test get_all_words()
 def test_get_all_words_empty():
     """Test getting all words from empty database."""
-    setup_test_database()
-    try:
-        words = database.get_all_words()
-        assert words == [], f"Expected empty list, got {words}"
-        print("[PASS] test_get_all_words_empty")
-    finally:
-        teardown_test_database()
+    words = database.get_all_words()
+    assert words == [], f"Expected empty list, got {words}"
+    print("[PASS] test_get_all_words_empty")
 
 
 def test_get_all_words_multiple():
     """Test getting all words with multiple entries."""
-    setup_test_database()
-    try:
-        # Add test words
-        add_test_word("der mann", "NOUN", None, "the man", 3)
-        add_test_word("die frau", "NOUN", None, "the woman", 2)
-        add_test_word("laufen", "VERB", False, "to run", 4)
+    # Add test words
+    add_test_words_bulk([
+        ("der mann", "NOUN", None, "the man", 3),
+        ("die frau", "NOUN", None, "the woman", 2),
+        ("laufen", "VERB", False, "to run", 4),
+    ])
 
-        words = database.get_all_words()
-        assert len(words) == 3, f"Expected 3 words, got {len(words)}"
+    words = database.get_all_words()
+    assert len(words) == 3, f"Expected 3 words, got {len(words)}"
 
-        # Check format: (word, pos, is_regular, translation, difficulty)
-        assert len(words[0]) == 5, "Expected 5 fields per word"
+    # Check format: (word, pos, is_regular, translation, difficulty)
+    assert len(words[0]) == 5, "Expected 5 fields per word"
 
-        # Check alphabetical order
-        word_names = [w[0] for w in words]
-        assert word_names == sorted(word_names), "Words should be alphabetically sorted"
+    # Check alphabetical order (as returned by ORDER BY word)
+    word_names = [w[0] for w in words]
+    assert word_names == ["der mann", "die frau", "laufen"], f"Words should be alphabetically sorted, got {word_names}"
 
-        print("[PASS] test_get_all_words_multiple")
-    finally:
-        teardown_test_database()
+    print("[PASS] test_get_all_words_multiple")
 
 
 def test_get_all_words_filter_difficulty():
     """Test filtering words by difficulty."""
-    setup_test_database()
-    try:
-        # Add words with different difficulties
-        add_test_word("testword1", "NOUN", None, "test1", difficulty=1)
-        add_test_word("testword2", "NOUN", None, "test2", difficulty=2)
-        add_test_word("testword3", "NOUN", None, "test3", difficulty=3)
-        add_test_word("testword4", "NOUN", None, "test4", difficulty=3)
+    # Add words with different difficulties
+    add_test_words_bulk([
+        ("testword1", "NOUN", None, "test1", 1),
+        ("testword2", "NOUN", None, "test2", 2),
+        ("testword3", "NOUN", None, "test3", 3),
+        ("testword4", "NOUN", None, "test4", 3),
+    ])
+
+    # Filter by difficulty 3
+    words_diff_3 = database.get_all_words(filters={'difficulty': 3})
 
-        # Filter by difficulty 3
-        words_diff_3 = database.get_all_words(filters={'difficulty': 3})
+    # Check that at least 2 words with difficulty 3 exist (our test words)
+    assert len(words_diff_3) >= 2, f"Expected at least 2 words with difficulty 3, got {len(words_diff_3)}"
 
-        # Check that at least 2 words with difficulty 3 exist (our test words)
-        assert len(words_diff_3) >= 2, f"Expected at least 2 words with difficulty 3, got {len(words_diff_3)}"
+    # Check all returned words have difficulty 3
+    for word in words_diff_3:
+        assert word[4] == 3, f"Expected difficulty 3, got {word[4]}"
 
-        # Check all returned words have difficulty 3
-        for word in words_diff_3:
-            assert word[4] == 3, f"Expected difficulty 3, got {word[4]}"
+    # Filter by difficulty 2
+    words_diff_2 = database.get_all_words(filters={'difficulty': 2})
+    # Just verify filtering works (at least our test word should be there)
+    assert len(words_diff_2) >= 1, f"Expected at least 1 word with difficulty 2"
 
-        # Filter by difficulty 2
-        words_diff_2 = database.get_all_words(filters={'difficulty': 2})
-        # Just verify filtering works (at least our test word should be there)
-        assert len(words_diff_2) >= 1, f"Expected at least 1 word with difficulty 2"
+    # Verify all returned words have difficulty 2
+    for word in words_diff_2:
+        assert word[4] == 2, f"Expected difficulty 2, got {word[4]}"
 
-        # Verify all returned words have difficulty 2
-        for word in words_diff_2:
-            assert word[4] == 2, f"Expected difficulty 2, got {word[4]}"
+    print("[PASS] test_get_all_words_filter_difficulty")
 
-        print("[PASS] test_get_all_words_filter_difficulty")
-    finally:
-        teardown_test_database()
+
+def test_get_all_words_filter_difficulty_uses_index():
+    """Test that difficulty filtering reads words in order from the composite index."""
+    plan = TEST_DB.conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT word, pos, is_regular, translation, difficulty "
+        f"FROM {database.TABLE_NAME} WHERE difficulty = ? ORDER BY word ASC", (3,)
+    ).fetchall()
+    details = " ".join(row[-1] for row in plan)
+
+    assert "idx_vocab_diff_word" in details, f"Expected composite index in plan: {details}"
+    assert "TEMP B-TREE" not in details, f"Expected no separate sort step: {details}"
+    print("[PASS] test_get_all_words_filter_difficulty_uses_index")
 
 
 def test_get_all_words_search_term():
     """Test searching words by term."""
-    setup_test_database()
-    try:
-        # Add test words
-        add_test_word("der mann", "NOUN", None, "the man", 3)
-        add_test_word("die frau", "NOUN", None, "the woman", 2)
-        add_test_word("das kind", "NOUN", None, "the child", 1)
+    # Add test words
+    add_test_words_bulk([
+        ("der mann", "NOUN", None, "the man", 3),
+        ("die frau", "NOUN", None, "the woman", 2),
+        ("das kind", "NOUN", None, "the child", 1),
+    ])
+
+    # Search for "mann"
+    words = database.get_all_words(search_term="mann")
+    assert len(words) == 1, f"Expected 1 word, got {len(words)}"
+    assert "mann" in words[0][0], "Should find 'mann'"
 
-        # Search for "mann"
-        words = database.get_all_words(search_term="mann")
-        assert len(words) == 1, f"Expected 1 word, got {len(words)}"
-        assert "mann" in words[0][0], "Should find 'mann'"
+    # Search for "the" (in translation)
+    words = database.get_all_words(search_term="the")
+    assert len(words) == 3, f"Expected 3 words with 'the', got {len(words)}"
 
-        # Search for "the" (in translation)
-        words = database.get_all_words(search_term="the")
-        assert len(words) == 3, f"Expected 3 words with 'the', got {len(words)}"
+    print("[PASS] test_get_all_words_search_term")
 
-        print("[PASS] test_get_all_words_search_term")
-    finally:
-        teardown_test_database()
+
+def test_get_all_words_search_substring():
+    """Test that search matches inside compound words, short terms, and tracks deletions."""
+    add_test_words_bulk([
+        ("der herzinfarkt", "NOUN", None, "heart attack", 4),
+        ("die herzklappe", "NOUN", None, "heart valve", 4),
+    ])
+
+    words = database.get_all_words(search_term="infarkt")
+    assert [w[0] for w in words] == ["der herzinfarkt"], f"Expected compound match, got {words}"
+
+    # Terms shorter than three characters still use a substring scan
+    words = database.get_all_words(search_term="rz")
+    assert len(words) == 2, f"Expected 2 words for short term, got {len(words)}"
+
+    with contextlib.closing(database.connect_db()) as conn, conn:
+        conn.execute(f"DELETE FROM {database.TABLE_NAME} WHERE word = ?", ("der herzinfarkt",))
+    words = database.get_all_words(search_term="heart")
+    assert [w[0] for w in words] == ["die herzklappe"], f"Deleted word should not match, got {words}"
+
+    print("[PASS] test_get_all_words_search_substring")
+
+
+def test_get_all_words_search_without_fts(monkeypatch):
+    """Test that search falls back to LIKE on SQLite builds without the trigram tokenizer."""
+    detected = database._fts_enabled.get(database.DB_FILE)
+    monkeypatch.setattr(database.sqlite3, "sqlite_version_info", (3, 33, 0))
+
+    with MemoryDatabase() as keepalive:
+        assert database._fts_enabled[database.DB_FILE] is False, "FTS should be disabled before SQLite 3.34"
+        fts_table = keepalive.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'vocab_fts'").fetchone()
+        assert fts_table is None, "vocab_fts should not be created"
+
+        add_test_words_bulk([
+            ("der herzinfarkt", "NOUN", None, "heart attack", 4),
+            ("die herzklappe", "NOUN", None, "heart valve", 4),
+        ])
+        words = database.get_all_words(search_term="infarkt")
+        assert [w[0] for w in words] == ["der herzinfarkt"], f"Expected LIKE match, got {words}"
+
+    # The module's own test database keeps whatever support it was initialised with
+    monkeypatch.undo()
+    assert database._fts_enabled.get(database.DB_FILE) == detected, "Other databases should be unaffected"
+    print("[PASS] test_get_all_words_search_without_fts")
 
 
 def test_get_all_words_combined_filters():
     """Test combining difficulty filter and search term."""
-    setup_test_database()
-    try:
-        # Add test words with unique search terms
-        add_test_word("testcombined1", "NOUN", None, "unique1", 3)
-        add_test_word("testcombined2", "NOUN", None, "unique2", 3)
-        add_test_word("testcombined3", "NOUN", None, "unique3", 2)
+    # Add test words with unique search terms
+    add_test_words_bulk([
+        ("testcombined1", "NOUN", None, "unique1", 3),
+        ("testcombined2", "NOUN", None, "unique2", 3),
+        ("testcombined3", "NOUN", None, "unique3", 2),
+    ])
 
-        # Search for difficulty 3 AND containing "unique"
-        words = database.get_all_words(filters={'difficulty': 3}, search_term="unique")
-        assert len(words) >= 2, f"Expected at least 2 words, got {len(words)}"
+    # Search for difficulty 3 AND containing "unique"
+    words = database.get_all_words(filters={'difficulty': 3}, search_term="unique")
+    assert len(words) >= 2, f"Expected at least 2 words, got {len(words)}"
 
-        # Verify all results match both criteria
-        for word in words:
-            assert word[4] == 3, f"Word should have difficulty 3, got {word[4]}"
-            assert "unique" in word[0] or "unique" in (word[3] or ""), f"Word should contain 'unique'"
+    # Verify all results match both criteria
+    for word in words:
+        assert word[4] == 3, f"Word should have difficulty 3, got {word[4]}"
+        assert "unique" in word[0] or "unique" in (word[3] or ""), f"Word should contain 'unique'"
 
-        print("[PASS] test_get_all_words_combined_filters")
-    finally:
-        teardown_test_database()
+    print("[PASS] test_get_all_words_combined_filters")
 
 
 # Test get_all_sessions()
 def test_get_all_sessions_empty():
     """Test getting sessions from empty temp database."""
-    setup_test_database()
-    try:
-        sessions = database.get_all_sessions()
-        assert sessions == [], f"Expected empty list, got {sessions}"
-        print("[PASS] test_get_all_sessions_empty")
-    finally:
-        teardown_test_database()
+    sessions = database.get_all_sessions()
+    assert sessions == [], f"Expected empty list, got {sessions}"
+    print("[PASS] test_get_all_sessions_empty")
 
 
 def test_get_all_sessions_single():
     """Test getting single session."""
-    setup_test_database()
-    try:
-        session_id = "test_session_1"
+    session_id = "test_session_1"
 
-        # Add words to session
-        add_test_temp_word("mann", "der mann", session_id)
-        add_test_temp_word("frau", "die frau", session_id)
+    # Add words to session
+    add_test_temp_word("mann", "der mann", session_id)
+    add_test_temp_word("frau", "die frau", session_id)
 
-        sessions = database.get_all_sessions()
-        assert len(sessions) == 1, f"Expected 1 session, got {len(sessions)}"
+    sessions = database.get_all_sessions()
+    assert len(sessions) == 1, f"Expected 1 session, got {len(sessions)}"
 
-        # Check format: (session_id, word_count, created_at)
-        assert len(sessions[0]) == 3, "Expected 3 fields per session"
-        assert sessions[0][0] == session_id, "Session ID mismatch"
-        assert sessions[0][1] == 2, f"Expected 2 words, got {sessions[0][1]}"
+    # Check format: (session_id, word_count, created_at)
+    assert len(sessions[0]) == 3, "Expected 3 fields per session"
+    assert sessions[0][0] == session_id, "Session ID mismatch"
+    assert sessions[0][1] == 2, f"Expected 2 words, got {sessions[0][1]}"
 
-        print("[PASS] test_get_all_sessions_single")
-    finally:
-        teardown_test_database()
+    print("[PASS] test_get_all_sessions_single")
 
 
 def test_get_all_sessions_multiple():
     """Test getting multiple sessions."""
-    setup_test_database()
-    try:
-        # Add words to different sessions
-        add_test_temp_word("word1", "lemma1", "session_1")
-        add_test_temp_word("word2", "lemma2", "session_1")
-        add_test_temp_word("word3", "lemma3", "session_2")
+    # Add words to different sessions
+    database.add_temp_words_bulk([
+        ("word1", "lemma1", "NOUN", "test", None, "session_1"),
+        ("word2", "lemma2", "NOUN", "test", None, "session_1"),
+        ("word3", "lemma3", "NOUN", "test", None, "session_2"),
+    ])
 
-        sessions = database.get_all_sessions()
-        assert len(sessions) == 2, f"Expected 2 sessions, got {len(sessions)}"
+    sessions = database.get_all_sessions()
 
-        # Find sessions by ID
-        session_dict = {s[0]: s[1] for s in sessions}
-        assert session_dict["session_1"] == 2, "Session 1 should have 2 words"
-        assert session_dict["session_2"] == 1, "Session 2 should have 1 word"
+    # Compare word counts by session ID in one go
+    session_counts = {s[0]: s[1] for s in sessions}
+    assert session_counts == {"session_1": 2, "session_2": 1}, f"Unexpected sessions: {session_counts}"
 
-        print("[PASS] test_get_all_sessions_multiple")
-    finally:
-        teardown_test_database()
+    print("[PASS] test_get_all_sessions_multiple")
 
 
 # Test get_session_stats()
 def test_get_session_stats_valid():
     """Test getting stats for valid session."""
-    setup_test_database()
-    try:
-        session_id = "test_session"
+    session_id = "test_session"
 
-        # Add words to session
-        add_test_temp_word("word1", "lemma1", session_id)
-        add_test_temp_word("word2", "lemma2", session_id)
-        add_test_temp_word("word3", "lemma3", session_id)
+    # Add words to session
+    add_test_temp_word("word1", "lemma1", session_id)
+    add_test_temp_word("word2", "lemma2", session_id)
+    add_test_temp_word("word3", "lemma3", session_id)
 
-        stats = database.get_session_stats(session_id)
+    stats = database.get_session_stats(session_id)
 
-        assert isinstance(stats, dict), "Stats should be a dict"
-        assert stats['total'] == 3, f"Expected total=3, got {stats['total']}"
-        assert stats['pending'] == 3, f"Expected pending=3, got {stats['pending']}"
+    assert isinstance(stats, dict), "Stats should be a dict"
+    assert stats['total'] == 3, f"Expected total=3, got {stats['total']}"
+    assert stats['pending'] == 3, f"Expected pending=3, got {stats['pending']}"
 
-        print("[PASS] test_get_session_stats_valid")
-    finally:
-        teardown_test_database()
+    print("[PASS] test_get_session_stats_valid")
 
 
 def test_get_session_stats_invalid():
     """Test getting stats for invalid session."""
-    setup_test_database()
-    try:
-        stats = database.get_session_stats("nonexistent_session")
+    stats = database.get_session_stats("nonexistent_session")
 
-        assert isinstance(stats, dict), "Stats should be a dict"
-        assert stats['total'] == 0, f"Expected total=0, got {stats['total']}"
-        assert stats['pending'] == 0, f"Expected pending=0, got {stats['pending']}"
+    assert isinstance(stats, dict), "Stats should be a dict"
+    assert stats['total'] == 0, f"Expected total=0, got {stats['total']}"
+    assert stats['pending'] == 0, f"Expected pending=0, got {stats['pending']}"
 
-        print("[PASS] test_get_session_stats_invalid")
-    finally:
-        teardown_test_database()
+    print("[PASS] test_get_session_stats_invalid")
 
 
 def test_get_session_stats_empty_session():
     """Test getting stats for empty session."""
-    setup_test_database()
-    try:
-        session_id = "empty_session"
-        # Don't add any words
+    session_id = "empty_session"
+    # Don't add any words
 
-        stats = database.get_session_stats(session_id)
+    stats = database.get_session_stats(session_id)
 
-        assert stats['total'] == 0, f"Expected total=0, got {stats['total']}"
-        assert stats['pending'] == 0, f"Expected pending=0, got {stats['pending']}"
+    assert stats['total'] == 0, f"Expected total=0, got {stats['total']}"
+    assert stats['pending'] == 0, f"Expected pending=0, got {stats['pending']}"
 
-        print("[PASS] test_get_session_stats_empty_session")
-    finally:
-        teardown_test_database()
+    print("[PASS] test_get_session_stats_empty_session")
 
 
 def run_all_tests():
@@ -342,9 +367,11 @@ def run_all_tests():
         # get_all_words tests
         test_get_all_words_empty,
         test_get_all_words_multiple,
-        # Skipping test_get_all_words_filter_difficulty due to test isolation issues
-        # Function works correctly - verified in test_debug.py
+        test_get_all_words_filter_difficulty,
+        test_get_all_words_filter_difficulty_uses_index,
         test_get_all_words_search_term,
+        test_get_all_words_search_substring,
+        test_get_all_words_search_without_fts,
         test_get_all_words_combined_filters,
         # get_all_sessions tests
         test_get_all_sessions_empty,
@@ -356,16 +383,23 @@ def run_all_tests():
         test_get_session_stats_empty_session,
     ]
 
+    setup_test_database()
     failed = []
     for test in tests:
         try:
-            test()
+            reset_test_database()
+            with pytest.MonkeyPatch.context() as monkeypatch:
+                if "monkeypatch" in inspect.signature(test).parameters:
+                    test(monkeypatch)
+                else:
+                    test()
         except AssertionError as e:
             print(f"[FAIL] {test.__name__} FAILED: {e}")
             failed.append(test.__name__)
         except Exception as e:
             print(f"[ERROR] {test.__name__} ERROR: {e}")
             failed.append(test.__name__)
+    teardown_test_database()
 
     print("\n" + "=" * 80)
     if failed:
@@ -7,27 +7,32 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import sqlite3
-import tempfile
-from database import add_word, word_exists, connect_db, DB_FILE
+import contextlib
+from database import add_word, word_exists, connect_db
+from memory_db import MemoryDatabase
+
+TEST_DB = None
+
+def setup_function(function=None):
+    """Point the database module at a fresh in-memory database for each test."""
+    global TEST_DB
+    TEST_DB = MemoryDatabase()
+    TEST_DB.open()
+
+def teardown_function(function=None):
+    """Drop the in-memory database and restore the real database path."""
+    TEST_DB.close()
 
 def test_add_word_with_translation():
     """Test that add_word works with translation parameter."""
-    # Clean test by removing any existing test words
-    conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM vocab WHERE word = 'testword'")
-    conn.commit()
-    conn.close()
-    
     # Test adding word with translation
     add_word('testword', 'NOUN', True, 'test translation')
     
     # Verify word was added with translation
-    conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute("SELECT word, pos, is_regular, translation FROM vocab WHERE word = 'testword'")
-    result = cursor.fetchone()
-    conn.close()
+    with contextlib.closing(connect_db()) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT word, pos, is_regular, translation FROM vocab WHERE word = 'testword'")
+        result = cursor.fetchone()
     
     assert result is not None, "Word was not added to database"
     assert result[0] == 'testword', "Word field incorrect"
@@ -37,22 +42,14 @@ def test_add_word_with_translation():
 
 def test_add_word_without_translation():
     """Test that add_word works without translation parameter (backward compatibility)."""
-    # Clean test by removing any existing test words
-    conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM vocab WHERE word = 'testword2'")
-    conn.commit()
-    conn.close()
-    
     # Test adding word without translation (should default to None)
     add_word('testword2', 'VERB', False)
     
     # Verify word was added with null translation
-    conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute("SELECT word, pos, is_regular, translation FROM vocab WHERE word = 'testword2'")
-    result = cursor.fetchone()
-    conn.close()
+    with contextlib.closing(connect_db()) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT word, pos, is_regular, translation FROM vocab WHERE word = 'testword2'")
+        result = cursor.fetchone()
     
     assert result is not None, "Word was not added to database"
     assert result[0] == 'testword2', "Word field incorrect"
@@ -62,17 +59,21 @@ def test_add_word_without_translation():
 
 def test_database_schema_has_translation_column():
     """Test that the database schema includes the translation column."""
-    conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute("PRAGMA table_info(vocab)")
-    columns = cursor.fetchall()
-    conn.close()
+    with contextlib.closing(connect_db()) as conn:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(vocab)")
+        columns = cursor.fetchall()
     
     column_names = [col[1] for col in columns]
     assert 'translation' in column_names, "Translation column not found in vocab table schema"
 
 if __name__ == "__main__":
-    test_add_word_with_translation()
-    test_add_word_without_translation()
-    test_database_schema_has_translation_column()
+    for test in (test_add_word_with_translation,
+                 test_add_word_without_translation,
+                 test_database_schema_has_translation_column):
+        setup_function(test)
+        try:
+            test()
+        finally:
+            teardown_function(test)
     print("All database translation tests passed!")
\ No newline at end of file
@@ -13,73 +13,44 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from database import (
-    init_database, connect_db, add_temp_word, approve_word,
-    word_exists, DB_FILE, TABLE_NAME, clear_session
+    add_temp_word, approve_word,
+    word_exists, TABLE_NAME, clear_session
 )
+from memory_db import MemoryDatabase
 
 
 @pytest.fixture
 def test_db():
-    """Set up and tear down test database."""
-    # Backup existing database if it exists
-    backup_path = None
-    if os.path.exists(DB_FILE):
-        backup_path = DB_FILE + ".backup"
-        if os.path.exists(backup_path):
-            os.remove(backup_path)
-        os.rename(DB_FILE, backup_path)
+    """Fresh shared in-memory test database; yields its connection for verification queries."""
+    with MemoryDatabase() as keepalive:
+        yield keepalive
 
-    # Initialize fresh database
-    init_database()
 
-    yield
-
-    # Clean up
-    if os.path.exists(DB_FILE):
-        os.remove(DB_FILE)
-
-    # Restore backup if it existed
-    if backup_path and os.path.exists(backup_path):
-        os.rename(backup_path, DB_FILE)
+@pytest.fixture(scope="module")
+def vocab_columns():
+    """PRAGMA table_info rows for the vocab table keyed by column name (read once per module)."""
+    with MemoryDatabase() as keepalive:
+        return {col[1]: col for col in keepalive.execute(f"PRAGMA table_info({TABLE_NAME})")}
 
 
-def test_difficulty_column_exists(test_db):
+def test_difficulty_column_exists(vocab_columns):
     """Test that difficulty column exists in vocab table."""
-    conn = connect_db()
-    cursor = conn.cursor()
-
-    # Get table info
-    cursor.execute(f"PRAGMA table_info({TABLE_NAME})")
-    columns = cursor.fetchall()
-
     # Check if difficulty column exists
-    column_names = [col[1] for col in columns]
-    assert 'difficulty' in column_names, "Difficulty column should exist in vocab table"
+    assert 'difficulty' in vocab_columns, "Difficulty column should exist in vocab table"
 
     # Check difficulty column type
-    difficulty_col = [col for col in columns if col[1] == 'difficulty'][0]
+    difficulty_col = vocab_columns['difficulty']
     assert 'INTEGER' in difficulty_col[2].upper(), "Difficulty column should be INTEGER type"
 
-    conn.close()
-
 
-def test_difficulty_default_value(test_db):
+def test_difficulty_default_value(vocab_columns):
     """Test that difficulty has default value of 3."""
-    conn = connect_db()
-    cursor = conn.cursor()
-
-    # Get table info
-    cursor.execute(f"PRAGMA table_info({TABLE_NAME})")
-    columns = cursor.fetchall()
-
     # Find difficulty column and check default value
-    difficulty_col = [col for col in columns if col[1] == 'difficulty'][0]
+    difficulty_col = vocab_columns['difficulty']
     default_value = difficulty_col[4]  # Column index 4 is the default value
 
     assert default_value == '3', "Difficulty default value should be 3 (medium)"
 
-    conn.close()
-
 
 def test_approve_word_with_difficulty(test_db):
     """Test approving a word with specific difficulty level."""
@@ -95,11 +66,7 @@ def test_approve_word_with_difficulty(test_db):
     # Verify word exists in main database with correct difficulty
     assert word_exists("haus"), "Word should exist in main database"
 
-    conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT difficulty FROM {TABLE_NAME} WHERE word = ?", ("haus",))
-    difficulty = cursor.fetchone()[0]
-    conn.close()
+    difficulty = test_db.execute(f"SELECT difficulty FROM {TABLE_NAME} WHERE word = ?", ("haus",)).fetchone()[0]
 
     assert difficulty == 4, "Word should have difficulty level 4"
 
@@ -119,11 +86,7 @@ def test_approve_word_default_difficulty(test_db):
     assert result is True, "Word should be approved successfully"
 
     # Verify word has default difficulty of 3
-    conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT difficulty FROM {TABLE_NAME} WHERE word = ?", ("katze",))
-    difficulty = cursor.fetchone()[0]
-    conn.close()
+    difficulty = test_db.execute(f"SELECT difficulty FROM {TABLE_NAME} WHERE word = ?", ("katze",)).fetchone()[0]
 
     assert difficulty == 3, "Word should have default difficulty level 3"
 
@@ -131,35 +94,29 @@ def test_approve_word_default_difficulty(test_db):
     clear_session(session_id)
 
 
-def test_all_difficulty_levels(test_db):
-    """Test all difficulty levels (0-4)."""
+@pytest.mark.parametrize("word,lemma,pos,translation,is_regular,difficulty,level_name", [
+    ("und", "und", "CCONJ", "and", None, 0, "known"),
+    ("Hund", "hund", "NOUN", "dog", True, 1, "supereasy"),
+    ("trotzdem", "trotzdem", "ADV", "nevertheless", None, 2, "easy"),
+    ("Werkzeug", "werkzeug", "NOUN", "tool", True, 3, "medium"),
+    ("verweilen", "verweilen", "VERB", "linger", False, 4, "hard"),
+])
+def test_all_difficulty_levels(test_db, word, lemma, pos, translation, is_regular, difficulty, level_name):
+    """Test each difficulty level (0-4)."""
     session_id = "test_session_levels"
 
-    test_words = [
-        ("und", "und", "CCONJ", "and", None, 0, "known"),
-        ("Hund", "hund", "NOUN", "dog", True, 1, "supereasy"),
-        ("trotzdem", "trotzdem", "ADV", "nevertheless", None, 2, "easy"),
-        ("Werkzeug", "werkzeug", "NOUN", "tool", True, 3, "medium"),
-        ("verweilen", "verweilen", "VERB", "linger", False, 4, "hard"),
-    ]
+    # Add to temp database
+    add_temp_word(word, lemma, pos, translation, is_regular, session_id)
 
-    for word, lemma, pos, translation, is_regular, difficulty, level_name in test_words:
-        # Add to temp database
-        add_temp_word(word, lemma, pos, translation, is_regular, session_id)
+    # Approve with specific difficulty
+    result = approve_word(lemma, session_id, difficulty=difficulty)
+    assert result is True, f"Word '{lemma}' should be approved"
 
-        # Approve with specific difficulty
-        result = approve_word(lemma, session_id, difficulty=difficulty)
-        assert result is True, f"Word '{lemma}' should be approved"
+    # Verify difficulty in database
+    stored_difficulty = test_db.execute(f"SELECT difficulty FROM {TABLE_NAME} WHERE word = ?", (lemma,)).fetchone()[0]
 
-        # Verify difficulty in database
-        conn = connect_db()
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT difficulty FROM {TABLE_NAME} WHERE word = ?", (lemma,))
-        stored_difficulty = cursor.fetchone()[0]
-        conn.close()
-
-        assert stored_difficulty == difficulty, \
-            f"Word '{lemma}' should have difficulty {difficulty} ({level_name})"
+    assert stored_difficulty == difficulty, \
+        f"Word '{lemma}' should have difficulty {difficulty} ({level_name})"
 
     # Clean up
     clear_session(session_id)
@@ -177,20 +134,14 @@ def test_difficulty_with_tags(test_db):
     assert result is True, "Word should be approved successfully"
 
     # Verify word has correct difficulty
-    conn = connect_db()
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT difficulty FROM {TABLE_NAME} WHERE word = ?", ("herzinfarkt",))
-    difficulty = cursor.fetchone()[0]
+    difficulty = test_db.execute(f"SELECT difficulty FROM {TABLE_NAME} WHERE word = ?", ("herzinfarkt",)).fetchone()[0]
 
     # Verify tags exist
-    cursor.execute("""
+    tags = [row[0] for row in test_db.execute("""
         SELECT t.tag_name FROM tags t
         JOIN word_tags wt ON t.tag_id = wt.tag_id
         WHERE wt.word = ?
-    """, ("herzinfarkt",))
-    tags = [row[0] for row in cursor.fetchall()]
-
-    conn.close()
+    """, ("herzinfarkt",))]
 
     assert difficulty == 4, "Word should have difficulty 4"
     assert "medical" in tags, "Word should have 'medical' tag"
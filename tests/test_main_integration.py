@@ -7,6 +7,10 @@ Tests cover:
 - Session management integration
 - Database function availability
 - Review interface integration
+
+The class shares one session, created with a generated id in setUpClass and
+deleted in tearDownClass, so the module can be sharded across workers, e.g.
+`pytest -n auto tests/test_main_integration.py` with pytest-xdist installed.
 """
 
 import sys
@@ -20,6 +24,20 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 class TestMainIntegration(unittest.TestCase):
     """Test main.py integration with session management controller."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Run the pipeline once and create one manager; the tests below only read from them."""
+        from session_manager import start_processing_session, SessionManager
+
+        cls.session_id, cls.session_result = start_processing_session(
+            "Ein einfacher Test für die Integration.")
+        cls.manager = SessionManager()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Delete the shared session."""
+        cls.manager.delete_session(cls.session_id)
+
     def test_imports(self):
         """Test that all required imports are available."""
         try:
@@ -47,9 +65,8 @@ class TestMainIntegration(unittest.TestCase):
         """Test that SessionManager can be initialized."""
         from session_manager import SessionManager
 
-        manager = SessionManager()
-        self.assertIsNotNone(manager)
-        self.assertIsInstance(manager.sessions, dict)
+        self.assertIsInstance(self.manager, SessionManager)
+        self.assertIsInstance(self.manager.sessions, dict)
 
     def test_session_status_enum(self):
         """Test that SessionStatus enum is available and has required values."""
@@ -59,56 +76,30 @@ class TestMainIntegration(unittest.TestCase):
         required_statuses = ['CREATED', 'PROCESSING', 'COMPLETED', 'FAILED', 'PENDING_REVIEW']
 
         for status_name in required_statuses:
-            self.assertTrue(hasattr(SessionStatus, status_name),
-                            f"SessionStatus should have {status_name}")
+            with self.subTest(status=status_name):
+                self.assertTrue(hasattr(SessionStatus, status_name),
+                                f"SessionStatus should have {status_name}")
 
     def test_start_processing_session_function(self):
         """Test that start_processing_session function works."""
-        from session_manager import start_processing_session, SessionManager
-
-        test_text = "Ein einfacher Test für die Integration."
-
-        try:
-            session_id, result = start_processing_session(test_text)
-
-            # Clean up
-            manager = SessionManager()
-            manager.delete_session(session_id)
-
-            # Verify result structure
-            self.assertIsNotNone(session_id)
-            self.assertIsInstance(result, dict)
-            self.assertIn('session_id', result)
-            self.assertIn('status', result)
-            self.assertIn('statistics', result)
-
-        except Exception as e:
-            self.fail(f"start_processing_session failed: {e}")
+        # Verify result structure
+        self.assertIsNotNone(self.session_id)
+        self.assertIsInstance(self.session_result, dict)
+        self.assertIn('session_id', self.session_result)
+        self.assertIn('status', self.session_result)
+        self.assertIn('statistics', self.session_result)
 
     def test_get_session_info_function(self):
         """Test that get_session_info function works."""
-        from session_manager import start_processing_session, get_session_info, SessionManager
+        from session_manager import get_session_info
 
-        test_text = "Test für get_session_info Funktion."
+        info = get_session_info(self.session_id)
 
-        try:
-            session_id, _ = start_processing_session(test_text)
-
-            # Get session info
-            info = get_session_info(session_id)
-
-            # Clean up
-            manager = SessionManager()
-            manager.delete_session(session_id)
-
-            # Verify info structure
-            self.assertIsNotNone(info)
-            self.assertEqual(info['session_id'], session_id)
-            self.assertIn('statistics', info)
-            self.assertIn('status', info)
-
-        except Exception as e:
-            self.fail(f"get_session_info failed: {e}")
+        # Verify info structure
+        self.assertIsNotNone(info)
+        self.assertEqual(info['session_id'], self.session_id)
+        self.assertIn('statistics', info)
+        self.assertIn('status', info)
 
     def test_database_functions_available(self):
         """Test that database functions used in main.py are available."""
@@ -127,51 +118,39 @@ class TestMainIntegration(unittest.TestCase):
 
     def test_display_session_summary_logic(self):
         """Test that session summary display logic works with real data."""
-        from session_manager import start_processing_session, get_session_info, SessionManager
-
-        test_text = "Testtext für Session-Zusammenfassung."
+        from session_manager import get_session_info
 
-        try:
-            session_id, _ = start_processing_session(test_text)
+        session_info = get_session_info(self.session_id)
+        self.assertIsNotNone(session_info)
 
-            # Get session info
-            session_info = get_session_info(session_id)
+        # Verify all required keys for display_session_summary
+        required_keys = ['session_id', 'status', 'duration_seconds', 'statistics',
+                         'error_message', 'text_preview']
 
-            # Clean up
-            manager = SessionManager()
-            manager.delete_session(session_id)
-
-            # Verify all required keys for display_session_summary
-            required_keys = ['session_id', 'status', 'duration_seconds', 'statistics',
-                             'error_message', 'text_preview']
-
-            for key in required_keys:
+        for key in required_keys:
+            with self.subTest(key=key):
                 self.assertIn(key, session_info, f"session_info should have key '{key}'")
 
-            # Verify statistics structure
-            stats = session_info['statistics']
-            required_stats = ['total_words_processed', 'words_added', 'words_translated',
-                              'words_pending_review']
+        # Verify statistics structure
+        stats = session_info['statistics']
+        required_stats = ['total_words_processed', 'words_added', 'words_translated',
+                          'words_pending_review']
 
-            for stat in required_stats:
+        for stat in required_stats:
+            with self.subTest(stat=stat):
                 self.assertIn(stat, stats, f"statistics should have key '{stat}'")
 
-        except Exception as e:
-            self.fail(f"Session summary logic failed: {e}")
-
     def test_session_manager_list_sessions(self):
         """Test that SessionManager.list_sessions works as expected in main.py."""
-        from session_manager import SessionManager, SessionStatus
-
-        manager = SessionManager()
+        from session_manager import SessionStatus
 
         # Test listing all sessions
         try:
-            all_sessions = manager.list_sessions()
+            all_sessions = self.manager.list_sessions()
             self.assertIsInstance(all_sessions, list)
 
             # Test listing with status filter
-            pending_sessions = manager.list_sessions(status_filter=SessionStatus.PENDING_REVIEW)
+            pending_sessions = self.manager.list_sessions(status_filter=SessionStatus.PENDING_REVIEW)
             self.assertIsInstance(pending_sessions, list)
 
         except Exception as e:
@@ -2,11 +2,17 @@
 """
 Comprehensive test suite for parser module with batch processing workflow.
 Tests all parser functions, translation integration, and temporary database storage.
+
+Each test works in its own uuid-suffixed session, so the module can be
+collected by pytest and sharded across workers, e.g.
+`pytest -n auto tests/test_parser.py` with pytest-xdist installed.
 """
 
 import sys
 import os
 import unittest
+import uuid
+import functools
 from unittest.mock import patch
 
 # Add src to path for imports
@@ -21,55 +27,89 @@ from parser import (  # noqa: E402
     process_text_input
 )
 from database import (  # noqa: E402
-    get_temp_words,
-    clear_temp_session
+    get_temp_words
 )
+from memory_db import MemoryDatabase  # noqa: E402
 
+# Shared in-memory database, unique per process so xdist workers stay apart
+TEST_DB = MemoryDatabase("test_parser")
 
-class TestParserFunctions(unittest.TestCase):
-    """Test individual parser functions."""
 
-    def test_clean_text_input(self):
-        """Test text cleaning functionality."""
-        # Test normal text
-        result = clean_text_input("Hallo Welt!")
-        self.assertEqual(result, "Hallo Welt!")
+def setUpModule():
+    """Point the database module at a shared in-memory DB kept alive by one connection."""
+    TEST_DB.open()
 
-        # Test excessive whitespace
-        result = clean_text_input("  Hallo    Welt!  \n\t  ")
-        self.assertEqual(result, "Hallo Welt!")
 
-        # Test empty input
-        result = clean_text_input("")
-        self.assertEqual(result, "")
+def tearDownModule():
+    """Drop the in-memory database and restore the real database path.
 
-        # Test whitespace-only input
-        result = clean_text_input("   \n\t  ")
-        self.assertEqual(result, "")
+    Tests use uuid-suffixed session ids and leave their temp words in place;
+    closing the last connection discards them all at once.
+    """
+    TEST_DB.close()
+    # The cached session's rows went away with the database
+    _processed_session.cache_clear()
 
-        # Test None input
-        result = clean_text_input(None)
-        self.assertEqual(result, "")
 
-    def test_tokenize_text(self):
-        """Test tokenization functionality."""
-        # Test normal German text
-        result = tokenize_text("Ich gehe heute zur Schule.")
-        expected = ["ich", "gehe", "heute", "zur", "schule"]
-        self.assertEqual(result, expected)
+PROCESSED_TEXT = "Das schöne Haus steht dort."
 
-        # Test empty input
-        result = tokenize_text("")
-        self.assertEqual(result, [])
 
-        # Test punctuation filtering
-        result = tokenize_text("Hallo, Welt! 123 @#$")
-        expected = ["hallo", "welt"]
-        self.assertEqual(result, expected)
+def _translate_nouns(lemma, pos):
+    """Mock translation: only nouns get a translation."""
+    return f"translation_of_{lemma}" if pos == "NOUN" else None
 
-        # Test numbers and symbols are filtered out
-        result = tokenize_text("123 !@# $%^ &*()")
-        self.assertEqual(result, [])
+
+def _patch_translation(test_case):
+    """Patch parser.get_best_translation for one test so no real translator is hit.
+
+    The mock returns "test_translation"; tests needing other behavior adjust
+    test_case.mock_translation directly.
+    """
+    patcher = patch('parser.get_best_translation', return_value="test_translation")
+    test_case.mock_translation = patcher.start()
+    test_case.addCleanup(patcher.stop)
+
+
+@functools.lru_cache(maxsize=None)
+def _processed_session():
+    """Run PROCESSED_TEXT through the pipeline once and share it across read-only tests.
+
+    Returns (session_id, result, temp_words, translation_calls). The session
+    lives in the in-memory database and goes away with it in tearDownModule.
+    """
+    session_id = f"test_processed_{uuid.uuid4().hex[:8]}"
+    with patch('parser.get_best_translation', side_effect=_translate_nouns) as mock_translation:
+        result = process_text_input(PROCESSED_TEXT, session_id=session_id)
+    return session_id, result, get_temp_words(session_id), mock_translation.call_count
+
+
+class TestParserFunctions(unittest.TestCase):
+    """Test individual parser functions."""
+
+    def test_clean_text_input(self):
+        """Test text cleaning functionality."""
+        cases = [
+            ("Hallo Welt!", "Hallo Welt!"),               # normal text
+            ("  Hallo    Welt!  \n\t  ", "Hallo Welt!"),  # excessive whitespace
+            ("", ""),                                     # empty input
+            ("   \n\t  ", ""),                            # whitespace-only input
+            (None, ""),                                   # None input
+        ]
+        for raw_text, expected in cases:
+            with self.subTest(raw_text=raw_text):
+                self.assertEqual(clean_text_input(raw_text), expected)
+
+    def test_tokenize_text(self):
+        """Test tokenization functionality."""
+        cases = [
+            ("Ich gehe heute zur Schule.", ["ich", "gehe", "heute", "zur", "schule"]),  # normal German text
+            ("", []),                                                                   # empty input
+            ("Hallo, Welt! 123 @#$", ["hallo", "welt"]),                                # punctuation filtering
+            ("123 !@# $%^ &*()", []),                                                   # numbers and symbols
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(tokenize_text(text), expected)
 
     def test_lemmatize_words(self):
         """Test lemmatization functionality."""
@@ -122,24 +162,12 @@ class TestBatchProcessingPipeline(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         # Create unique session ID for each test
-        import uuid
         self.test_session = f"test_session_{uuid.uuid4().hex[:8]}"
+        _patch_translation(self)
 
-    def tearDown(self):
-        """Clean up after each test."""
-        # Clean up test session
-        clear_temp_session(self.test_session)
-
-    @patch('parser.get_best_translation')
-    def test_process_text_input_with_translations(self, mock_translation):
+    def test_process_text_input_with_translations(self):
         """Test complete pipeline with mocked translations."""
-        # Mock translation service
-        mock_translation.side_effect = lambda lemma, pos: f"translation_of_{lemma}" if pos == "NOUN" else None
-
-        # Test text with various word types
-        test_text = "Das schöne Haus steht dort."
-
-        result = process_text_input(test_text, session_id=self.test_session)
+        session_id, result, temp_words, translation_calls = _processed_session()
 
         # Verify result structure
         self.assertIsNotNone(result)
@@ -147,20 +175,18 @@ class TestBatchProcessingPipeline(unittest.TestCase):
         self.assertIn('words_processed', result)
         self.assertIn('words_added', result)
         self.assertIn('words_translated', result)
-        self.assertEqual(result['session_id'], self.test_session)
+        self.assertEqual(result['session_id'], session_id)
 
         # Verify words were added to temp database
-        temp_words = get_temp_words(self.test_session)
         self.assertGreater(len(temp_words), 0)
 
         # Verify translations were attempted
-        mock_translation.assert_called()
+        self.assertGreater(translation_calls, 0)
 
-    @patch('parser.get_best_translation')
-    def test_translation_failure_handling(self, mock_translation):
+    def test_translation_failure_handling(self):
         """Test pipeline handles translation failures gracefully."""
         # Mock translation service to always fail
-        mock_translation.return_value = None
+        self.mock_translation.return_value = None
 
         test_text = "Ein kleines Beispiel."
 
@@ -179,11 +205,8 @@ class TestBatchProcessingPipeline(unittest.TestCase):
             translation = word_record[3]  # translation column
             self.assertIsNone(translation)
 
-    @patch('parser.get_best_translation')
-    def test_session_isolation(self, mock_translation):
+    def test_session_isolation(self):
         """Test that different sessions are isolated."""
-        mock_translation.return_value = "test_translation"
-
         # Process text in first session
         result1 = process_text_input("Erstes Beispiel.", session_id=self.test_session)
 
@@ -202,9 +225,6 @@ class TestBatchProcessingPipeline(unittest.TestCase):
         self.assertGreater(len(words1), 0)
         self.assertGreater(len(words2), 0)
 
-        # Clean up second session
-        clear_temp_session(session2)
-
     def test_empty_input_handling(self):
         """Test handling of empty and invalid inputs."""
         # Test empty string
@@ -219,11 +239,8 @@ class TestBatchProcessingPipeline(unittest.TestCase):
         result = process_text_input("123 !@# $%^", session_id=self.test_session)
         self.assertIsNone(result)
 
-    @patch('parser.get_best_translation')
-    def test_irregular_verb_detection(self, mock_translation):
+    def test_irregular_verb_detection(self):
         """Test that irregular verbs are correctly identified."""
-        mock_translation.return_value = "test_translation"
-
         # Use text with irregular verbs (if available in irregular_Verbs.txt)
         test_text = "Ich bin hier gewesen."  # sein is irregular
 
@@ -241,11 +258,8 @@ class TestBatchProcessingPipeline(unittest.TestCase):
                     is_regular = word_record[4]  # is_regular column
                     self.assertIsNotNone(is_regular)  # Should be True or False, not None
 
-    @patch('parser.get_best_translation')
-    def test_duplicate_word_handling(self, mock_translation):
+    def test_duplicate_word_handling(self):
         """Test that duplicate words in same session are handled correctly."""
-        mock_translation.return_value = "test_translation"
-
         # Process same text twice in same session
         test_text = "Das gleiche Wort das gleiche Wort."
 
@@ -257,11 +271,8 @@ class TestBatchProcessingPipeline(unittest.TestCase):
             self.assertLessEqual(result2['words_added'], result1['words_added'])
 
     @patch('parser.temp_word_exists')
-    @patch('parser.get_best_translation')
-    def test_database_error_handling(self, mock_translation, mock_temp_exists):
+    def test_database_error_handling(self, mock_temp_exists):
         """Test handling of database errors during processing."""
-        mock_translation.return_value = "test_translation"
-
         # Mock database error
         mock_temp_exists.side_effect = Exception("Database error")
 
@@ -282,46 +293,34 @@ class TestTemporaryDatabaseIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test environment."""
-        import uuid
         self.test_session = f"test_db_session_{uuid.uuid4().hex[:8]}"
+        _patch_translation(self)
 
-    def tearDown(self):
-        """Clean up after each test."""
-        clear_temp_session(self.test_session)
-
-    @patch('parser.get_best_translation')
-    def test_temp_database_storage(self, mock_translation):
+    def test_temp_database_storage(self):
         """Test that words are correctly stored in temporary database."""
-        mock_translation.return_value = "test_translation"
-
-        test_text = "Ein kurzer Test für die Datenbank."
-
-        result = process_text_input(test_text, session_id=self.test_session)
+        test_session, result, temp_words, _ = _processed_session()
 
         self.assertIsNotNone(result)
 
         # Verify data in temp database
-        temp_words = get_temp_words(self.test_session)
         self.assertGreater(len(temp_words), 0)
 
         # Verify data structure
         for word_record in temp_words:
-            self.assertEqual(len(word_record), 7)  # word, lemma, pos, translation, is_regular, session_id, created_at
+            with self.subTest(word=word_record[0]):
+                self.assertEqual(len(word_record), 7)  # word, lemma, pos, translation, is_regular, session_id, created_at
 
-            word, lemma, pos, translation, is_regular, session_id, created_at = word_record
+                word, lemma, pos, translation, is_regular, session_id, created_at = word_record
 
-            # Verify data types and content
-            self.assertIsInstance(word, str)
-            self.assertIsInstance(lemma, str)
-            self.assertIsInstance(pos, str)
-            self.assertEqual(session_id, self.test_session)
-            self.assertIsNotNone(created_at)
+                # Verify data types and content
+                self.assertIsInstance(word, str)
+                self.assertIsInstance(lemma, str)
+                self.assertIsInstance(pos, str)
+                self.assertEqual(session_id, test_session)
+                self.assertIsNotNone(created_at)
 
-    @patch('parser.get_best_translation')
-    def test_session_id_consistency(self, mock_translation):
+    def test_session_id_consistency(self):
         """Test that session ID is consistently used throughout processing."""
-        mock_translation.return_value = "test_translation"
-
         custom_session = f"custom_{self.test_session}"
 
         result = process_text_input("Test mit eigener Session.", session_id=custom_session)
@@ -335,9 +334,6 @@ class TestTemporaryDatabaseIntegration(unittest.TestCase):
             session_id = word_record[5]  # session_id column
             self.assertEqual(session_id, custom_session)
 
-        # Clean up custom session
-        clear_temp_session(custom_session)
-
 
 def run_comprehensive_tests():
     """Run all test suites and return results."""
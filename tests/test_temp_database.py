@@ -8,7 +8,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import uuid
 from database import (
-    add_temp_word, get_temp_words, remove_temp_word, 
+    add_temp_word, add_temp_words_bulk, get_temp_words, remove_temp_word, 
     clear_temp_session, temp_word_exists, connect_db
 )
 
@@ -34,6 +34,21 @@ def test_add_temp_word():
     # Clean up
     clear_temp_session(session_id)
 
+def test_add_temp_words_bulk():
+    """Test adding several words to temporary database in one call."""
+    session_id = f"test_{uuid.uuid4().hex[:8]}"
+    
+    result = add_temp_words_bulk(
+        (f'bulkword{i}', f'bulkword{i}', 'NOUN', f'translation{i}', True, session_id)
+        for i in range(3)
+    )
+    
+    assert result is True, "add_temp_words_bulk should return True on success"
+    assert len(get_temp_words(session_id)) == 3, "All bulk words should be stored"
+    
+    # Clean up
+    clear_temp_session(session_id)
+
 def test_get_temp_words():
     """Test retrieving words from temporary database."""
     session_id = f"test_{uuid.uuid4().hex[:8]}"
@@ -158,6 +173,7 @@ def test_temp_database_schema():
 
 if __name__ == "__main__":
     test_add_temp_word()
+    test_add_temp_words_bulk()
     test_get_temp_words()
     test_remove_temp_word()
     test_clear_temp_session()
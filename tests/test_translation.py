@@ -3,6 +3,8 @@ from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # Add src directory to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -40,36 +42,15 @@ class TestTranslationService(unittest.TestCase):
         mock_get.assert_called_once_with('http://test.com', timeout=5.0)
     
     @patch('translation.requests.Session.get')
-    @patch('translation.time.sleep')
-    def test_make_request_timeout_retry(self, mock_sleep, mock_get):
-        """Test request timeout with retry logic."""
+    def test_make_request_timeout(self, mock_get):
+        """Test request timeout handling."""
         import requests
         
-        # Mock timeout on first call, success on second
-        mock_get.side_effect = [
-            requests.exceptions.Timeout("Timeout"),
-            Mock(json=lambda: {'success': True}, raise_for_status=lambda: None)
-        ]
-        
-        result = self.service._make_request('http://test.com')
-        
-        self.assertEqual(result, {'success': True})
-        self.assertEqual(mock_get.call_count, 2)
-        mock_sleep.assert_called_once_with(1)  # First retry delay
-    
-    @patch('translation.requests.Session.get')
-    @patch('translation.time.sleep')
-    def test_make_request_max_retries_exceeded(self, mock_sleep, mock_get):
-        """Test request failure after max retries."""
-        import requests
-        
-        # Mock failure on all attempts
         mock_get.side_effect = requests.exceptions.Timeout("Timeout")
         
         result = self.service._make_request('http://test.com')
         
         self.assertIsNone(result)
-        self.assertEqual(mock_get.call_count, 2)  # max_retries = 2
     
     @patch('translation.requests.Session.get')
     def test_make_request_http_error(self, mock_get):
@@ -110,7 +91,18 @@ class TestTranslationService(unittest.TestCase):
         translations = self.service._extract_translations(content, 'NOUN')
         self.assertIn('haus', translations)
         self.assertIn('building', translations)
-    
+
+    def test_extract_translations_ascii_only(self):
+        """Test that non-ASCII and non-alphabetic candidates are dropped."""
+        content = '''
+        ==English==
+        ===Translations===
+        German: [[Häuser]], [[big house]], [[haus2]]
+        '''
+
+        translations = self.service._extract_translations(content, 'NOUN')
+        self.assertEqual(translations, ['big house'])
+
     def test_get_translation_empty_lemma(self):
         """Test translation with empty lemma."""
         result = self.service.get_translation('', 'NOUN')
@@ -132,6 +124,16 @@ class TestTranslationService(unittest.TestCase):
         self.assertEqual(result['lemma'], 'haus')
         self.assertEqual(result['pos'], 'NOUN')
     
+    @patch('translation.TranslationService._make_request')
+    def test_get_translation_escapes_title(self, mock_request):
+        """Test that URL-special characters in the lemma stay inside the titles parameter."""
+        mock_request.return_value = None
+        
+        self.service.get_translation('a&b c', 'NOUN')
+        
+        url = mock_request.call_args[0][0]
+        self.assertIn('titles=a%26b%20c&', url)
+    
     @patch('translation.TranslationService._make_request')
     def test_get_translation_word_not_found(self, mock_request):
         """Test translation when word is not found in Wiktionary."""
@@ -297,6 +299,92 @@ class TestTranslationService(unittest.TestCase):
         self.assertEqual(summary, expected)
 
 
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answers every request with the status code named in the path, e.g. /503.
+    
+    /slow stalls past the client timeout before answering 200.
+    """
+    
+    hits = {}
+    
+    def do_GET(self):
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        if self.path == '/slow':
+            # Event.wait rather than time.sleep, which the tests patch
+            threading.Event().wait(0.5)
+            status = 200
+        else:
+            status = int(self.path.strip('/'))
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRetryAdapter(unittest.TestCase):
+    """Test the session's retry policy against a local HTTP server.
+    
+    Requests go through the mounted HTTPAdapter and urllib3 Retry, unlike the
+    tests above that patch Session.get.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+    
+    def setUp(self):
+        _StubHandler.hits.clear()
+        self.service = TranslationService(timeout=5.0, max_retries=3)
+        # Keep environment proxies away from the loopback stub server
+        self.service.session.trust_env = False
+    
+    @patch('urllib3.util.retry.time.sleep')
+    def test_server_error_is_retried(self, mock_sleep):
+        """Test that a 503 is attempted max_retries times in total."""
+        result = self.service._make_request(f"{self.base_url}/503")
+        
+        self.assertIsNone(result)
+        self.assertEqual(_StubHandler.hits['/503'], self.service.max_retries)
+    
+    @patch('urllib3.util.retry.time.sleep')
+    def test_rate_limit_is_retried(self, mock_sleep):
+        """Test that a 429 is attempted max_retries times in total."""
+        result = self.service._make_request(f"{self.base_url}/429")
+        
+        self.assertIsNone(result)
+        self.assertEqual(_StubHandler.hits['/429'], self.service.max_retries)
+    
+    @patch('urllib3.util.retry.time.sleep')
+    def test_read_timeout_is_retried(self, mock_sleep):
+        """Test that a read timeout is retried and reported as a timeout."""
+        self.service.timeout = 0.1
+        
+        with self.assertLogs('translation', level='ERROR') as logs:
+            result = self.service._make_request(f"{self.base_url}/slow")
+        
+        self.assertIsNone(result)
+        self.assertEqual(_StubHandler.hits['/slow'], self.service.max_retries)
+        self.assertIn("timed out", logs.output[0])
+    
+    @patch('urllib3.util.retry.time.sleep')
+    def test_client_error_is_not_retried(self, mock_sleep):
+        """Test that a 404 is attempted exactly once."""
+        result = self.service._make_request(f"{self.base_url}/404")
+        
+        self.assertIsNone(result)
+        self.assertEqual(_StubHandler.hits['/404'], 1)
+        mock_sleep.assert_not_called()
+
+
 class TestConvenienceFunctions(unittest.TestCase):
     """Test cases for convenience functions."""
     
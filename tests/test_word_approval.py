@@ -15,6 +15,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 # Import after path setup  # noqa: E402
 from database import (  # noqa: E402
     approve_word,
+    approve_words_batch,
     reject_word,
     get_pending_words,
     clear_session,
@@ -130,6 +131,38 @@ class TestApproveWord(unittest.TestCase):
         # Should fail
         self.assertFalse(result)
 
+    def test_approve_words_batch(self):
+        """Test approving several words in one transaction."""
+        approved = approve_words_batch([
+            ("haus", self.test_session, 2, ["noun"]),
+            ("schön", self.test_session, 4, None),
+        ])
+
+        self.assertEqual(approved, 2)
+        self.assertTrue(word_exists("haus"))
+        self.assertTrue(word_exists("schön"))
+        self.assertIn("noun", [tag[0] for tag in get_word_tags("haus")])
+
+        # Only the unapproved word should remain pending
+        pending = get_pending_words(self.test_session)
+        self.assertEqual([word[1] for word in pending], ["laufen"])
+
+    def test_approve_words_batch_skips_missing_and_existing(self):
+        """Test that batch approval skips unknown and already-approved words."""
+        approve_word("laufen", self.test_session)
+        add_temp_word("laufen", "laufen", "VERB", "run", False, self.test_session)
+
+        approved = approve_words_batch([
+            ("nonexistent", self.test_session, 3, None),
+            ("laufen", self.test_session, 3, None),
+            ("haus", self.test_session, 3, None),
+        ])
+
+        self.assertEqual(approved, 1)
+        temp_lemmas = [word[1] for word in get_temp_words(self.test_session)]
+        self.assertNotIn("laufen", temp_lemmas)
+        self.assertNotIn("haus", temp_lemmas)
+
 
 class TestRejectWord(unittest.TestCase):
     """Test reject_word functionality."""